@@ -1,5 +1,8 @@
 from . import utils
 from . import phenotypes
 from . import phases
+from . import population
 from .cell_volume import CellVolumes
 from .phenotypes import get_phenotype_by_name
+from .population import PhasePopulation
+from .phases import set_seed
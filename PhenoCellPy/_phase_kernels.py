@@ -0,0 +1,308 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2023, Juliano Ferrari Gianlupi
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from numpy import dtype as _dtype, exp, less, maximum, minimum
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is an optional dependency, without it the kernels run as plain numpy code
+    njit = None
+
+# Rows of the volume array used by the population kernels, the array has shape (len(VOLUME_FIELDS), number of cells).
+# The names match the attributes of :class:`PhenoCellPy.cell_volume.CellVolumes`
+VOLUME_FIELDS = ("fluid", "nuclear_fluid", "cytoplasm_fluid", "nuclear_solid", "cytoplasm_solid", "solid", "nuclear",
+                 "cytoplasm", "total", "fluid_fraction", "calcified_fraction", "target_fluid_fraction",
+                 "nuclear_solid_target", "cytoplasm_solid_target", "target_cytoplasm_to_nuclear_ratio",
+                 "relative_rupture_volume", "rupture_volume")
+(FLUID, NUCLEAR_FLUID, CYTOPLASM_FLUID, NUCLEAR_SOLID, CYTOPLASM_SOLID, SOLID, NUCLEAR, CYTOPLASM, TOTAL,
+ FLUID_FRACTION, CALCIFIED_FRACTION, TARGET_FLUID_FRACTION, NUCLEAR_SOLID_TARGET, CYTOPLASM_SOLID_TARGET,
+ TARGET_CYTOPLASM_TO_NUCLEAR_RATIO, RELATIVE_RUPTURE_VOLUME, RUPTURE_VOLUME) = range(len(VOLUME_FIELDS))
+
+# Rows of the per-phase rate table, the table has shape (len(RATE_FIELDS), number of phases). The names match the
+# attributes of :class:`PhenoCellPy.phases.Phase`
+RATE_FIELDS = ("fluid_change_rate", "nuclear_volume_change_rate", "cytoplasm_volume_change_rate",
+               "calcification_rate")
+FLUID_CHANGE_RATE, NUCLEAR_VOLUME_CHANGE_RATE, CYTOPLASM_VOLUME_CHANGE_RATE, CALCIFICATION_RATE = \
+    range(len(RATE_FIELDS))
+
+
+def volume_dtype(number_of_cells, dtype):
+    """
+    Structured dtype with one field per name in `VOLUME_FIELDS`, each field an array of `number_of_cells` values.
+
+    One item of this dtype has the memory layout of a volume array (each volume contiguous for all the cells, a
+    structure of arrays), so it can name the rows of a volume array without copying it, e.g.,
+    `numpy.ndarray((), volume_dtype(n, volumes.dtype), buffer=volumes)["total"]` is a view of the total volumes.
+
+    :param number_of_cells: Number of cells (columns) of the volume array
+    :type number_of_cells: int
+    :param dtype: Floating point type of the volume array
+    :type dtype: numpy.dtype
+    :return: The structured dtype
+    :rtype: numpy.dtype
+    """
+    return _dtype([(name, dtype, (number_of_cells,)) for name in VOLUME_FIELDS])
+
+
+# Smallest population stepped in parallel when numba is installed. numba freezes module globals at compile time, a new
+# value only takes effect after deleting the on-disk cache (__pycache__)
+PARALLEL_MIN_CELLS = 500
+
+
+def _jit(function):
+    """Compiles `function` with numba, caching the machine code on disk, if numba is installed"""
+    if njit is None:
+        return function
+    return njit(cache=True)(function)
+
+
+@_jit
+def _relax(volume, target, rate, dt):
+    """
+    Exact solution of dV/dt = rate * (target - V) after `dt`, the ODE :func:`CellVolumes.update_volume` integrates
+    """
+    return target + (volume - target) * exp(-rate * dt)
+
+
+@_jit
+def _advance_volume(volumes, cells, fluid_change_rate, nuclear_volume_change_rate, cytoplasm_volume_change_rate,
+                    calcification_rate, dt):
+    """
+    Updates the volumes of `cells` in place. Same model, and same update order, as
+    :func:`PhenoCellPy.cell_volume.CellVolumes.update_volume` for one set of volumes; the relaxations are solved exactly
+    instead of with odeint, so the two agree to odeint's tolerance. How the volumes carry over when a cell changes phase
+    is up to the caller, see :class:`PhenoCellPy.population.PhasePopulation`.
+
+    `cells` is either one cell index, with scalar rates, or any numpy index of several cells (e.g., `slice(None)`),
+    with one rate per indexed cell.
+
+    :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell
+    :type volumes: numpy.ndarray
+    :param cells: Which cells to update
+    :type cells: int, slice, or numpy.ndarray
+    :param fluid_change_rate: Fluid change rate of the cells
+    :type fluid_change_rate: float or numpy.ndarray
+    :param nuclear_volume_change_rate: Nuclear volume change rate of the cells
+    :type nuclear_volume_change_rate: float or numpy.ndarray
+    :param cytoplasm_volume_change_rate: Cytoplasm volume change rate of the cells
+    :type cytoplasm_volume_change_rate: float or numpy.ndarray
+    :param calcification_rate: Calcification rate of the cells
+    :type calcification_rate: float or numpy.ndarray
+    :param dt: Time-step
+    :type dt: float
+    """
+    total = volumes[TOTAL, cells]
+    fluid = maximum(_relax(volumes[FLUID, cells], volumes[TARGET_FLUID_FRACTION, cells] * total, fluid_change_rate,
+                           dt), 0)
+    nuclear_fluid = maximum(volumes[NUCLEAR, cells] / (total + 1e-12) * fluid, 0)
+    cytoplasm_fluid = maximum(fluid - nuclear_fluid, 0)
+
+    nuclear_solid = maximum(_relax(volumes[NUCLEAR_SOLID, cells], volumes[NUCLEAR_SOLID_TARGET, cells],
+                                   nuclear_volume_change_rate, dt), 0)
+    cytoplasm_solid_target = maximum(volumes[TARGET_CYTOPLASM_TO_NUCLEAR_RATIO, cells] *
+                                     volumes[NUCLEAR_SOLID_TARGET, cells], 0)
+
+    cytoplasm_solid = maximum(_relax(volumes[CYTOPLASM_SOLID, cells], cytoplasm_solid_target,
+                                     cytoplasm_volume_change_rate, dt), 0)
+
+    nuclear = maximum(nuclear_solid + nuclear_fluid, 0)
+    cytoplasm = maximum(cytoplasm_solid + cytoplasm_fluid, 0)
+    total = maximum(nuclear + cytoplasm, 0)
+
+    volumes[FLUID, cells] = fluid
+    volumes[NUCLEAR_FLUID, cells] = nuclear_fluid
+    volumes[CYTOPLASM_FLUID, cells] = cytoplasm_fluid
+    volumes[NUCLEAR_SOLID, cells] = nuclear_solid
+    volumes[CYTOPLASM_SOLID_TARGET, cells] = cytoplasm_solid_target
+    volumes[CYTOPLASM_SOLID, cells] = cytoplasm_solid
+    volumes[SOLID, cells] = maximum(nuclear_solid + cytoplasm_solid, 0)
+    volumes[NUCLEAR, cells] = nuclear
+    volumes[CYTOPLASM, cells] = cytoplasm
+    volumes[CALCIFIED_FRACTION, cells] = minimum(maximum(_relax(volumes[CALCIFIED_FRACTION, cells], 1.,
+                                                                calcification_rate, dt), 0), 1)
+    volumes[TOTAL, cells] = total
+    volumes[FLUID_FRACTION, cells] = maximum(fluid / (total + 1e-12), 0)
+
+
+if njit is None:
+    def _update_volume_soa(volumes, phase_index, rates, dt):
+        """
+        Updates the volumes of every cell in place, see :func:`_advance_volume`.
+
+        :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell
+        :type volumes: numpy.ndarray
+        :param phase_index: Index of the current phase of each cell
+        :type phase_index: numpy.ndarray
+        :param rates: Per-phase rate table, rows as in `RATE_FIELDS`, one column per phase
+        :type rates: numpy.ndarray
+        :param dt: Time-step
+        :type dt: float
+        """
+        _advance_volume(volumes, slice(None), rates[FLUID_CHANGE_RATE][phase_index],
+                        rates[NUCLEAR_VOLUME_CHANGE_RATE][phase_index],
+                        rates[CYTOPLASM_VOLUME_CHANGE_RATE][phase_index], rates[CALCIFICATION_RATE][phase_index], dt)
+else:
+    def _update_volume_loop(volumes, phase_index, rates, dt):
+        """
+        Updates the volumes of every cell in place, see :func:`_advance_volume`. The cells are updated one by one,
+        without temporary arrays. Compiled twice below, serial and parallel.
+        """
+        for cell in prange(volumes.shape[1]):
+            phase = phase_index[cell]
+            _advance_volume(volumes, cell, rates[FLUID_CHANGE_RATE, phase], rates[NUCLEAR_VOLUME_CHANGE_RATE, phase],
+                            rates[CYTOPLASM_VOLUME_CHANGE_RATE, phase], rates[CALCIFICATION_RATE, phase], dt)
+
+    _update_volume_serial = njit(cache=True)(_update_volume_loop)
+    _update_volume_parallel = njit(cache=True, parallel=True)(_update_volume_loop)
+
+    @njit(cache=True)
+    def _update_volume_soa(volumes, phase_index, rates, dt):
+        """
+        Updates the volumes of every cell in place, see :func:`_advance_volume`. Populations of at least
+        `PARALLEL_MIN_CELLS` cells are updated in parallel, for smaller ones starting the threads costs more than it
+        saves.
+
+        :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell
+        :type volumes: numpy.ndarray
+        :param phase_index: Index of the current phase of each cell
+        :type phase_index: numpy.ndarray
+        :param rates: Per-phase rate table, rows as in `RATE_FIELDS`, one column per phase
+        :type rates: numpy.ndarray
+        :param dt: Time-step
+        :type dt: float
+        """
+        if volumes.shape[1] < PARALLEL_MIN_CELLS:
+            _update_volume_serial(volumes, phase_index, rates, dt)
+        else:
+            _update_volume_parallel(volumes, phase_index, rates, dt)
+
+
+@_jit
+def _stoch_transitions(random, transition_probability, out):
+    """
+    Stochastic phase transitions, each cell leaves its phase with its phase's transition probability
+
+    :param random: One uniform random number in [0, 1) per cell
+    :type random: numpy.ndarray
+    :param transition_probability: Transition probability in one time-step of the current phase of each cell
+    :type transition_probability: numpy.ndarray
+    :param out: Flags (bool) for which cells leave their phase, written in place
+    :type out: numpy.ndarray
+    """
+    less(random, transition_probability, out)
+
+
+@_jit
+def step_cohort(phase_index, time_in_phase, volumes, dt, phase_duration, transition_probability, rates, random,
+                out):
+    """
+    Time-steps a cohort of cells in place: advances the time in phase, updates the volumes and checks for phase
+    transitions. Mirrors the order of :func:`PhenoCellPy.phases.Phase.time_step_phase`.
+
+    Both transition rules are checked for every cell, without branching: deterministic phases must have a transition
+    probability of 0 and stochastic phases an infinite duration.
+
+    :param phase_index: Index of the current phase of each cell
+    :type phase_index: numpy.ndarray
+    :param time_in_phase: Time each cell has spent in its current phase, updated in place
+    :type time_in_phase: numpy.ndarray
+    :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell, updated in place
+    :type volumes: numpy.ndarray
+    :param dt: Time-step
+    :type dt: float
+    :param phase_duration: Per-phase duration of deterministic phases, infinite for stochastic phases
+    :type phase_duration: numpy.ndarray
+    :param transition_probability: Per-phase probability of a stochastic transition in one time-step, 0 for
+        deterministic phases
+    :type transition_probability: numpy.ndarray
+    :param rates: Per-phase rate table, rows as in `RATE_FIELDS`, one column per phase
+    :type rates: numpy.ndarray
+    :param random: One uniform random number in [0, 1) per cell
+    :type random: numpy.ndarray
+    :param out: Flags (bool) for which cells leave their phase, written in place
+    :type out: numpy.ndarray
+    """
+    time_in_phase += dt
+    _update_volume_soa(volumes, phase_index, rates, dt)
+    _stoch_transitions(random, transition_probability[phase_index], out)
+    out |= time_in_phase > phase_duration[phase_index]
+
+
+# Batch counterparts of the phase entry/exit functions, they act on every cell flagged in `cells` at once. They are
+# called once per time-step, numpy's masked operations are as fast as a compiled loop for them
+
+
+def double_target_volume(volumes, cells):
+    """
+    Doubles the target volumes of the flagged cells. Batch version of :func:`Phase._double_target_volume`
+
+    :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell, updated in place
+    :type volumes: numpy.ndarray
+    :param cells: Flags (bool) for which cells to act on
+    :type cells: numpy.ndarray
+    """
+    volumes[NUCLEAR_SOLID_TARGET][cells] *= 2
+    volumes[CYTOPLASM_SOLID_TARGET][cells] *= 2
+
+
+def halve_target_volume(volumes, cells):
+    """
+    Halves the target volumes of the flagged cells. Batch version of :func:`Phase._halve_target_volume`
+
+    :param volumes: Volume array, rows as in `VOLUME_FIELDS`, one column per cell, updated in place
+    :type volumes: numpy.ndarray
+    :param cells: Flags (bool) for which cells to act on
+    :type cells: numpy.ndarray
+    """
+    volumes[CYTOPLASM_SOLID_TARGET][cells] /= 2
+    volumes[NUCLEAR_SOLID_TARGET][cells] /= 2
+
+
+def compile_kernels():
+    """
+    Compiles the kernels and stores them in numba's on-disk cache, so that the first time-step of a simulation does not
+    pay for the compilation. Useful, e.g., when installing PhenoCellPy in a container image.
+
+    :return: True if the kernels were compiled, False if numba is not installed (there is nothing to compile)
+    :rtype: bool
+    """
+    if njit is None:
+        return False
+    from numpy import float32, float64, ones, zeros
+
+    # one compilation per precision of PhasePopulation
+    for dtype in (float64, float32):
+        step_cohort(zeros(1, dtype=int), zeros(1, dtype=dtype), ones((len(VOLUME_FIELDS), 1), dtype=dtype), 1.,
+                    ones(1), zeros(1, dtype=dtype), zeros((len(RATE_FIELDS), 1), dtype=dtype), zeros(1, dtype=dtype),
+                    zeros(1, dtype=bool))
+    return True
@@ -32,6 +32,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from scipy.integrate import odeint
 from numpy import array
 from copy import deepcopy
+from functools import lru_cache
 
 class CellVolumes:
     """
@@ -100,6 +101,16 @@ class CellVolumes:
 
     """
 
+    # every phase of every cell holds a CellVolumes, its state is kept in slots. The volumes are stored in the private
+    # attributes behind their properties
+    _STATE_ATTRIBUTES = ("time_unit", "space_unit", "_tff", "_nuclear_fluid", "_nuclear_solid", "_nst",
+                         "_cytoplasm_fluid", "_cytoplasm_solid", "_cst", "_cytoplasm", "_nuclear", "_tctnr",
+                         "_calc_frac", "relative_rupture_volume", "_fluid", "_solid", "_total", "_fluid_fraction",
+                         "rupture_volume")
+    # the __dict__ keeps user code (e.g., simulation steppables) free to set extra attributes on a cell's volume. It is
+    # only allocated when such an attribute is set
+    __slots__ = _STATE_ATTRIBUTES + ("__dict__",)
+
     def __init__(self, target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
                  cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
                  target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, relative_rupture_volume=None,
@@ -132,6 +143,35 @@ class CellVolumes:
         should be checked by Phase or Phenotype
         :type relative_rupture_volume: float
         """
+        # most cells are built with the same (often default) parameters, the resulting initial state is computed once
+        # and reused
+        parameters = (target_fluid_fraction, nuclear_fluid, nuclear_solid, nuclear_solid_target, cytoplasm_fluid,
+                      cytoplasm_solid, cytoplasm_solid_target, target_cytoplasm_to_nuclear_ratio, calcified_fraction,
+                      relative_rupture_volume, time_unit, space_unit)
+        try:
+            hash(parameters)
+        except TypeError:  # unhashable parameters (e.g., 0-d numpy arrays) can't be memoized
+            initial_state = self._initial_state.__wrapped__(type(self), *parameters)
+        else:
+            initial_state = self._initial_state(*parameters)
+        for name, value in initial_state:
+            setattr(self, name, value)
+
+    @classmethod
+    @lru_cache(maxsize=128, typed=True)
+    def _initial_state(cls, target_fluid_fraction, nuclear_fluid, nuclear_solid, nuclear_solid_target, cytoplasm_fluid,
+                       cytoplasm_solid, cytoplasm_solid_target, target_cytoplasm_to_nuclear_ratio, calcified_fraction,
+                       relative_rupture_volume, time_unit, space_unit):
+        """
+        Computes the initial attributes of a CellVolumes built with the given parameters (see :func:`__init__`).
+        Memoized, the returned attributes are immutable and can be shared by every CellVolumes built with the same
+        parameters.
+
+        :return: Pairs (attribute name, value)
+        :rtype: tuple
+        """
+        self = object.__new__(cls)
+
         # The defaults values below are reference parameter values for MCF-7, in cubic
         # https://www.sciencedirect.com/topics/medicine-and-dentistry/mcf-7
         _total = 2494
@@ -223,6 +263,8 @@ class CellVolumes:
 
         self.rupture_volume = self.relative_rupture_volume * self.total
 
+        return tuple((name, getattr(self, name)) for name in cls._STATE_ATTRIBUTES)
+
     @staticmethod
     def volume_relaxation(current_volume, t, rate, target_volume):
         """
@@ -343,11 +385,7 @@ class CellVolumes:
     @target_fluid_fraction.setter
     def target_fluid_fraction(self, value):
         """A fraction of something must be in [0, 1]"""
-        if value < 0:
-            value = 0
-        elif value > 1:
-            value = 1
-        self._tff = value
+        self._tff = min(max(value, 0), 1)
 
     @property
     def total(self):
@@ -459,11 +497,7 @@ class CellVolumes:
 
     @calcified_fraction.setter
     def calcified_fraction(self, value):
-        if value > 1:
-            value = 1
-        elif value < 0:
-            value = 0
-        self._calc_frac = value
+        self._calc_frac = min(max(value, 0), 1)
 
     @property
     def fluid_fraction(self):
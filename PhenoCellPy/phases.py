@@ -30,15 +30,94 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-from numpy import exp
-from numpy.random import uniform
+from math import expm1 as _expm1
+from numpy import broadcast, expm1, greater
+from numpy.random import default_rng, random as _numpy_uniform
+from random import Random
 
 from PhenoCellPy.cell_volume import CellVolumes
 
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
 
 
-# todo: change args handling to also accept tuples
+@dataclass(frozen=True)
+class PhaseSpec:
+    """
+    Immutable snapshot of the metadata of a phase, i.e., the attributes shared by every cell in that phase (the per-
+    cell state, `time_in_phase` and `volume`, is not part of it). Obtained from :attr:`Phase.spec`; phases with equal
+    metadata share the same PhaseSpec object.
+    """
+    name: str
+    index: int
+    previous_phase_index: int
+    next_phase_index: int
+    time_unit: str
+    dt: float
+    division_at_phase_exit: bool
+    removal_at_phase_exit: bool
+    fixed_duration: bool
+    phase_duration: float
+
+
+class PhaseRates(NamedTuple):
+    """
+    Volume change rates of a phase, in the order of the rows of the rate table used by
+    :class:`PhenoCellPy.population.PhasePopulation`. Obtained from :attr:`Phase.rates`.
+    """
+    fluid_change_rate: float
+    nuclear_volume_change_rate: float
+    cytoplasm_volume_change_rate: float
+    calcification_rate: float
+
+
+# random numbers of the stochastic phase transitions. By default they are drawn from numpy's global generator, so
+# that simulations seeded with numpy.random.seed stay reproducible. set_seed switches to PhenoCellPy's own generators:
+# the standard library generator for the per-cell check, the fastest for one number at a time, and a numpy PCG64
+# generator for the batch check
+_random = Random()
+_uniform = _numpy_uniform
+_rng = None
+
+
+def set_seed(seed=None):
+    """
+    Seeds the random number generators of the stochastic phase transitions (per-cell and batch).
+
+    Until this is called the transitions draw from numpy's global generator, seeded by :func:`numpy.random.seed`. After
+    it is called they draw from PhenoCellPy's own generators (:class:`random.Random` for the per-cell check, faster
+    than numpy for one number at a time, and :func:`numpy.random.default_rng` for the batch check), which
+    :func:`numpy.random.seed` does not affect.
+
+    :param seed: Seed for :class:`random.Random` and :func:`numpy.random.default_rng`. None seeds from the operating
+        system
+    :type seed: int or None
+    :return: No return
+    """
+    global _uniform, _rng
+    _random.seed(seed)
+    _uniform = _random.random
+    _rng = default_rng(seed)
+
+
+@lru_cache(maxsize=256)
+def _cached_phase_spec(phase_class, *fields):
+    """
+    PhaseSpec of `fields`, cached per (phase class, *PhaseSpec fields) so that phases with equal metadata share one
+    object. Bounded, as changing `dt` or `phase_duration` during a run creates new snapshots. See :attr:`Phase.spec`
+    """
+    return PhaseSpec(*fields)
+
+# Placeholder args of callbacks that take none (they are declared as `(self, *none)`), shared by all phases
+_NONE_ARGS = (None,)
+
+# Return values of :func:`Phase.time_step_phase` when the cell stays in the phenotype and no transition index is given
+_STAY_IN_PHASE = (False, False, None)
+_GO_TO_NEXT_PHASE = (True, False, None)
+
 
 class Phase:
     """
@@ -66,6 +145,9 @@ class Phase:
     _transition_to_next_phase_stochastic()
         Default stochastic transition function. Probability of transition depends on `dt` and `phase_duration`
 
+    batch_transition_stochastic(dt, phase_duration, rng=None)
+        Vectorized stochastic transition check for many cells, takes arrays of `dt` and `phase_duration`
+
     entry_function(*args)
         Optional function to be executed upon entering this phase. Some pre-build Phases have their own entry function
         already defined. It gets called using attribute `entry_function_args`. Must have no return
@@ -213,6 +295,9 @@ class Phase:
     :param user_phase_time_step_args: args for `user_phase_time_step`
     :type user_phase_time_step_args: list or tuple
 
+    :param volume: Cell volume submodel to use instead of building a new one from the volume parameters
+    :type volume: :class:`PhenoCellPy.cell_volume.CellVolumes`
+
     Attributes
     ----------
 
@@ -222,8 +307,42 @@ class Phase:
     volume : class:cell_volume.CellVolumes
         Cell volume submodel
 
+    spec : class:PhaseSpec
+        Shared, read-only, snapshot of this phase's metadata
+
     """
 
+    # no per-instance __dict__, a simulation holds one (or more) Phase objects per cell
+    __slots__ = ("index", "previous_phase_index", "next_phase_index", "time_unit", "space_unit", "_dt", "name",
+                 "division_at_phase_exit", "removal_at_phase_exit", "fixed_duration", "_phase_duration",
+                 "_p_transition", "time_in_phase", "entry_function", "entry_function_args", "exit_function",
+                 "exit_function_args", "arrest_function", "arrest_function_args",
+                 "check_transition_to_next_phase_function", "check_transition_to_next_phase_function_args",
+                 "simulated_cell_volume",
+                 "cytoplasm_volume_change_rate", "nuclear_volume_change_rate", "calcification_rate",
+                 "fluid_change_rate", "relative_rupture_volume", "user_phase_time_step", "user_phase_time_step_args",
+                 "volume")
+
+    def __init_subclass__(cls, **defaults):
+        """
+        Subclasses declare their default parameters as class keywords, e.g.,
+        `class S(Phase, index=1, name="S", phase_duration=480.0)`. They are merged, once, on top of the parent's
+        defaults (:data:`_PHASE_COMMON_DEFAULTS` for direct subclasses of Phase) into `cls._DEFAULTS`. Subclasses
+        that don't define `__init__` get one that calls :func:`Phase.__init__` with `cls._DEFAULTS` updated by the
+        keyword arguments given.
+
+        :param defaults: Default values for the parameters of :func:`Phase.__init__`
+        """
+        super().__init_subclass__()
+        if defaults:
+            cls._DEFAULTS = MappingProxyType({**getattr(cls, "_DEFAULTS", _PHASE_COMMON_DEFAULTS), **defaults})
+        if cls.__init__ is Phase.__init__ and hasattr(cls, "_DEFAULTS"):
+            cls.__init__ = Phase._init_with_defaults
+
+    def _init_with_defaults(self, **kwargs):
+        """`__init__` of the subclasses that only set defaults, see :func:`Phase.__init_subclass__`"""
+        Phase.__init__(self, **{**self._DEFAULTS, **kwargs})
+
     def __init__(self, index: int = None, previous_phase_index: int = None, next_phase_index: int = None,
                  dt: float = None, time_unit: str = "min", space_unit="micrometer", name: str = None,
                  division_at_phase_exit: bool = False, removal_at_phase_exit: bool = False,
@@ -235,7 +354,8 @@ class Phase:
                  target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
                  cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
                  target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=(None,)):
+                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=_NONE_ARGS,
+                 volume=None):
         """
 
         :param space_unit:
@@ -365,6 +485,10 @@ class Phase:
         :param user_phase_time_step_args: args for `user_phase_time_step`
         :type user_phase_time_step_args: list or tuple
 
+        :param volume: Cell volume submodel to use, e.g., one shared by all the phases of a cell. If None, a new one is
+        made from the volume parameters above (which are ignored otherwise)
+        :type volume: :class:`PhenoCellPy.cell_volume.CellVolumes` or None
+
         """
 
         if index is None:
@@ -379,8 +503,6 @@ class Phase:
         self.time_unit = time_unit
         self.space_unit = space_unit
 
-        if dt is None or dt <= 0:
-            raise ValueError(f"'dt' must be greater than 0. Got {dt}.")
         self.dt = dt
 
         if name is None:
@@ -393,42 +515,35 @@ class Phase:
 
         self.fixed_duration = fixed_duration
 
-        if phase_duration <= 0:
-            raise ValueError(f"'phase_duration' must be greater than 0. Got {phase_duration}")
-
         self.phase_duration = phase_duration
 
         self.time_in_phase = 0
 
         self.entry_function = entry_function  # function to be executed upon entering this phase
-        self.entry_function_args = entry_function_args
+        if entry_function and entry_function_args is None:
+            # entry functions given without args are called with the placeholder args, as the pre-built ones are
+            entry_function_args = _NONE_ARGS
+        self.entry_function_args = _args_tuple(entry_function_args)
 
         self.exit_function = exit_function  # function to be executed just before exiting this phase
-        self.exit_function_args = exit_function_args
-        if self.exit_function is not None and not (type(self.exit_function_args) == list or
-                                                   type(self.exit_function_args) == tuple):
-            raise TypeError("Exit function defined but no args given. Was expecting "
-                            f"'exit_function_args' to be a list or tupple, got {type(exit_function_args)}.")
+        self.exit_function_args = _args_tuple(exit_function_args)
+        _check_args("exit_function", exit_function, exit_function_args)
 
         self.arrest_function = arrest_function  # function determining if cell will exit cell cycle and become senescent
-        self.arrest_function_args = arrest_function_args
-
-        if self.arrest_function is not None and type(self.arrest_function_args) != list:
-            raise TypeError("Arrest function defined but no args given. Was expecting "
-                            f"'arrest_function_args' to be a list, got {type(arrest_function_args)}.")
+        self.arrest_function_args = _args_tuple(arrest_function_args)
+        _check_args("arrest_function", arrest_function, arrest_function_args)
 
         if check_transition_to_next_phase_function is None:
-            self.check_transition_to_next_phase_function_args = [None]
+            self.check_transition_to_next_phase_function_args = _NONE_ARGS
             if fixed_duration:
                 self.check_transition_to_next_phase_function = self._check_transition_to_next_phase_deterministic
             else:
                 self.check_transition_to_next_phase_function = self._check_transition_to_next_phase_stochastic
         else:
-            if type(check_transition_to_next_phase_function_args) != list:
-                raise TypeError("Custom exit function selected but no args given. Was expecting "
-                                "'check_transition_to_next_phase_function_args' to be a list, got "
-                                f"{type(check_transition_to_next_phase_function_args)}.")
-            self.check_transition_to_next_phase_function_args = check_transition_to_next_phase_function_args
+            _check_args("check_transition_to_next_phase_function", check_transition_to_next_phase_function,
+                        check_transition_to_next_phase_function_args)
+            self.check_transition_to_next_phase_function_args = \
+                _args_tuple(check_transition_to_next_phase_function_args)
             self.check_transition_to_next_phase_function = check_transition_to_next_phase_function
 
         if simulated_cell_volume is None:
@@ -458,23 +573,28 @@ class Phase:
         else:
             self.fluid_change_rate = fluid_change_rate
 
+        self.relative_rupture_volume = relative_rupture_volume
+
         self.user_phase_time_step = user_phase_time_step
 
         if self.user_phase_time_step is not None and \
-                not (type(user_phase_time_step_args) == list or type(user_phase_time_step_args) == tuple):
+                not isinstance(user_phase_time_step_args, (list, tuple)):
             raise ValueError(
                 f"`user_phase_time_step` is defined but `user_phase_time_step_args` is not list or "
                 f"tuple.\nGot {type(user_phase_time_step_args)} instead")
 
-        self.user_phase_time_step_args = user_phase_time_step_args
+        self.user_phase_time_step_args = _args_tuple(user_phase_time_step_args)
 
-        self.volume = CellVolumes(target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                                  nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                                  cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                                  cytoplasm_solid_target=cytoplasm_solid_target,
-                                  target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                                  calcified_fraction=calcified_fraction,
-                                  relative_rupture_volume=relative_rupture_volume)
+        if volume is not None:
+            self.volume = volume
+        else:
+            self.volume = CellVolumes(target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
+                                      nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
+                                      cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
+                                      cytoplasm_solid_target=cytoplasm_solid_target,
+                                      target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
+                                      calcified_fraction=calcified_fraction,
+                                      relative_rupture_volume=relative_rupture_volume)
 
     def update_volume(self):
         """
@@ -483,9 +603,44 @@ class Phase:
 
         :return: No return
         """
-        self.volume.update_volume(self.dt, self.fluid_change_rate, self.nuclear_volume_change_rate,
+        self.volume.update_volume(self._dt, self.fluid_change_rate, self.nuclear_volume_change_rate,
                                   self.cytoplasm_volume_change_rate, self.calcification_rate)
 
+    @property
+    def dt(self):
+        """Time-step size, in units of `time_unit`. `dt > 0`"""
+        return self._dt
+
+    @dt.setter
+    def dt(self, dt):
+        if dt is None or dt <= 0:
+            raise ValueError(f"'dt' must be greater than 0. Got {dt}.")
+        self._dt = dt
+        if hasattr(self, "_phase_duration"):
+            self._update_transition_probability()
+
+    @property
+    def phase_duration(self):
+        """(Expected) duration of the phase, in units of `time_unit`. `phase_duration > 0`"""
+        return self._phase_duration
+
+    @phase_duration.setter
+    def phase_duration(self, phase_duration):
+        if phase_duration <= 0:
+            raise ValueError(f"'phase_duration' must be greater than 0. Got {phase_duration}")
+        self._phase_duration = phase_duration
+        if hasattr(self, "_dt"):
+            self._update_transition_probability()
+
+    def _update_transition_probability(self):
+        """
+        Stores the probability of transition per time-step of the stochastic transition, p=1-exp(-dt/phase_duration).
+        It only depends on `dt` and `phase_duration`, so it is updated when they are set instead of every time-step.
+        """
+        # -expm1(-x) is 1-exp(-x) without the loss of digits for small x, so there is no need for the 1-exp(-x) ~ x
+        # approximation
+        self._p_transition = -_expm1(-self._dt / self._phase_duration)
+
     def _check_transition_to_next_phase_stochastic(self, *none):
         """
         Default stochastic phase transition function.
@@ -497,11 +652,33 @@ class Phase:
         :return: bool. random number < probability of transition
         """
 
-        # the approximation 1-exp(-x) ~ x can be used. That approximation has a difference of 0.005 at x=0.1, which I'd
-        # find acceptable. TODO: implement a check on self.dt / self.phase_duration, if it is < .1 use the approximation
+        return _uniform() < self._p_transition
 
-        prob = float(1 - exp(-self.dt / self.phase_duration))
-        return uniform() < prob
+    @staticmethod
+    def batch_transition_stochastic(dt, phase_duration, rng=None):
+        """
+        Vectorized :func:`_check_transition_to_next_phase_stochastic`: the transition check of many cells at once.
+
+        Computes the transition probabilities (p=1-exp(-dt/phase_duration)) of all the cells with one ufunc call and
+        compares them against one random number per cell.
+
+        :param dt: Time-step of each cell (or one for all)
+        :type dt: float or numpy.ndarray
+        :param phase_duration: Phase duration of each cell (or one for all)
+        :type phase_duration: float or numpy.ndarray
+        :param rng: Random number generator to draw from. If None, draws from the generator of the stochastic phase
+            transitions, numpy's global generator unless :func:`set_seed` was called
+        :type rng: numpy.random.Generator or None
+        :return: Flags (bool), one per cell, for the transition to the next phase
+        :rtype: numpy.ndarray
+        """
+        prob = -expm1(-dt / phase_duration)
+        shape = broadcast(dt, phase_duration).shape
+        if rng is None:
+            rng = _rng
+        if rng is None:
+            return _numpy_uniform(shape) < prob
+        return rng.random(shape) < prob
 
     def _check_transition_to_next_phase_deterministic(self, *none):
         """
@@ -512,7 +689,7 @@ class Phase:
         :param none: Not used. Placeholder in case of user defined function with args
         :return:
         """
-        return self.time_in_phase > self.phase_duration
+        return self.time_in_phase > self._phase_duration
 
     def time_step_phase(self):
         """
@@ -527,17 +704,19 @@ class Phase:
         :return: tuple. First element of tuple: bool denoting if the cell moves to the next phase. Second element:
         denotes if the cell leaves the cell cycle and enters senescence.
         """
-        self.time_in_phase += self.dt
+        self.time_in_phase += self._dt
 
         self.update_volume()
 
         transition_to_index = None
 
-        if self.user_phase_time_step is not None:
-            self.user_phase_time_step(*self.user_phase_time_step_args)
+        user_phase_time_step = self.user_phase_time_step
+        if user_phase_time_step is not None:
+            user_phase_time_step(*self.user_phase_time_step_args)
 
-        if self.arrest_function is not None:
-            exit_phenotype = self.arrest_function(*self.exit_function_args)
+        arrest_function = self.arrest_function
+        if arrest_function is not None:
+            exit_phenotype = arrest_function(*self.arrest_function_args)
             go_to_next_phase_in_phenotype = False
             return go_to_next_phase_in_phenotype, exit_phenotype, transition_to_index
         else:
@@ -546,13 +725,17 @@ class Phase:
         go_to_next_phase_in_phenotype = self.check_transition_to_next_phase_function(
             *self.check_transition_to_next_phase_function_args)
 
-        if hasattr(go_to_next_phase_in_phenotype, "len") and len(go_to_next_phase_in_phenotype) > 1:
+        if isinstance(go_to_next_phase_in_phenotype, (tuple, list)) and len(go_to_next_phase_in_phenotype) > 1:
             transition_to_index = go_to_next_phase_in_phenotype[1]
             go_to_next_phase_in_phenotype = go_to_next_phase_in_phenotype[0]
 
-        if go_to_next_phase_in_phenotype and self.exit_function is not None:
-            self.exit_function(*self.exit_function_args)
-            return go_to_next_phase_in_phenotype, exit_phenotype, transition_to_index
+        if go_to_next_phase_in_phenotype:
+            exit_function = self.exit_function
+            if exit_function is not None:
+                exit_function(*self.exit_function_args)
+        if transition_to_index is None:
+            # shared tuples for the usual outcomes, no new tuple per cell per step
+            return _GO_TO_NEXT_PHASE if go_to_next_phase_in_phenotype else _STAY_IN_PHASE
         return go_to_next_phase_in_phenotype, exit_phenotype, transition_to_index
 
     def _double_target_volume(self, *none):
@@ -582,6 +765,37 @@ class Phase:
     def copy(self):
         return deepcopy(self)
 
+    @property
+    def spec(self):
+        """
+        Snapshot of this phase's metadata (see :class:`PhaseSpec`).
+
+        The snapshot is taken from the current attribute values, and cached: phases of the same class with the same
+        metadata (e.g., the copies of a phase held by each cell) get the same PhaseSpec object. The cache keeps the 256
+        most recently used snapshots.
+
+        :return: The phase's metadata
+        :rtype: PhaseSpec
+        """
+        key = (type(self), self.name, self.index, self.previous_phase_index, self.next_phase_index, self.time_unit,
+               self.dt, self.division_at_phase_exit, self.removal_at_phase_exit, self.fixed_duration,
+               self.phase_duration)
+        try:
+            return _cached_phase_spec(*key)
+        except TypeError:  # unhashable metadata (e.g., numpy arrays) can't be cached
+            return PhaseSpec(*key[1:])
+
+    @property
+    def rates(self):
+        """
+        The phase's current volume change rates (see :class:`PhaseRates`).
+
+        :return: The phase's volume change rates
+        :rtype: PhaseRates
+        """
+        return PhaseRates(self.fluid_change_rate, self.nuclear_volume_change_rate, self.cytoplasm_volume_change_rate,
+                          self.calcification_rate)
+
     def __str__(self):
         return f"{self.name} phase, at memory {self.__repr__().split(' ')[-1][:-1]}"
 
@@ -590,7 +804,147 @@ class Phase:
         return f"{self.name} phase"
 
 
-class SenescentPhase(Phase):
+# Keyword defaults shared by the Phase subclasses, each subclass adds its own as class keywords (see
+# :func:`Phase.__init_subclass__`). See :class:`Phase` for their meaning
+_PHASE_COMMON_DEFAULTS = MappingProxyType({
+    "dt": 0.1, "time_unit": "min", "space_unit": "micrometer", "division_at_phase_exit": False,
+    "removal_at_phase_exit": False, "entry_function": None, "entry_function_args": None, "exit_function": None,
+    "exit_function_args": None, "arrest_function": None, "arrest_function_args": None,
+    "check_transition_to_next_phase_function": None, "check_transition_to_next_phase_function_args": None,
+    "simulated_cell_volume": None, "cytoplasm_volume_change_rate": None, "nuclear_volume_change_rate": None,
+    "calcification_rate": None, "target_fluid_fraction": None, "nuclear_fluid": None, "nuclear_solid": None,
+    "nuclear_solid_target": None, "cytoplasm_fluid": None, "cytoplasm_solid": None, "cytoplasm_solid_target": None,
+    "target_cytoplasm_to_nuclear_ratio": None, "calcified_fraction": None, "fluid_change_rate": None,
+    "relative_rupture_volume": None, "user_phase_time_step": None, "user_phase_time_step_args": None,
+    "volume": None})
+
+
+def _check_args(function_name, function, args):
+    """
+    Checks that a phase callback that is set comes with its args.
+
+    :param function_name: Name of the callback parameter, its args are `function_name + "_args"`
+    :type function_name: str
+    :param function: The callback, None if not set
+    :param args: Args for `function`
+    :raises TypeError: If `function` is set and `args` is not a list or tuple
+    """
+    if function is not None and not isinstance(args, (list, tuple)):
+        raise TypeError(f"'{function_name}' defined but no args given. Was expecting '{function_name}_args' to be a "
+                        f"list or tuple, got {type(args)}.")
+
+
+def _with_defaults(defaults, kwargs, none_to_default=()):
+    """
+    Merges a phase's keyword arguments on top of its defaults.
+
+    :param defaults: The phase's defaults, see :func:`Phase.__init_subclass__`
+    :type defaults: Mapping
+    :param kwargs: User given keyword arguments
+    :type kwargs: dict
+    :param none_to_default: Parameters that get their default when given as None
+    :type none_to_default: tuple of str
+    :return: The merged keyword arguments
+    :rtype: dict
+    """
+    kwargs = {**defaults, **kwargs}
+    for name in none_to_default:
+        if kwargs[name] is None:
+            kwargs[name] = defaults[name]
+    return kwargs
+
+
+# Parameters of the necrosis phases that fall back to the phase's default when given as None, as the necrosis phenotype
+# passes them
+_NECROSIS_NONE_DEFAULTS = ("phase_duration", "cytoplasm_volume_change_rate", "nuclear_volume_change_rate",
+                           "fluid_change_rate", "calcification_rate", "relative_rupture_volume")
+
+
+def _args_tuple(args):
+    """
+    Callback args are stored as tuples, which unpack faster than lists on every call. Other values (e.g., None) are
+    returned as is.
+    """
+    if isinstance(args, list):
+        return tuple(args)
+    return args
+
+
+def _inverse_steps(dt, phase_duration):
+    """
+    1 / (number of time-steps in a phase), used to default the volume change rates of some phases. Validates `dt` and
+    `phase_duration` as :class:`Phase` does, as it runs before :func:`Phase.__init__`.
+
+    :param dt: Time-step
+    :type dt: float
+    :param phase_duration: Phase duration
+    :type phase_duration: float
+    :return: `dt / phase_duration`
+    :rtype: float
+    """
+    if dt is None or dt <= 0:
+        raise ValueError(f"'dt' must be greater than 0. Got {dt}.")
+    if phase_duration <= 0:
+        raise ValueError(f"'phase_duration' must be greater than 0. Got {phase_duration}")
+    return dt / phase_duration
+
+
+def _default_rate(rate, volume_a, volume_b, inv_steps, fallback=1):
+    """
+    Default volume change rate of phases that grow the cell: the given volumes changed over the phase duration.
+
+    :param rate: User given rate, returned as is if not None
+    :type rate: float or None
+    :param volume_a: Volume to change during the phase
+    :type volume_a: float or None
+    :param volume_b: Second volume to change during the phase
+    :type volume_b: float or None
+    :param inv_steps: 1 / (number of time-steps in the phase), see :func:`_inverse_steps`
+    :type inv_steps: float
+    :param fallback: Rate used if neither the rate nor the volumes are given
+    :type fallback: float
+    :return: The volume change rate
+    :rtype: float
+    """
+    if rate is not None:
+        return rate
+    if volume_a is None and volume_b is None:
+        return fallback
+    return ((volume_a or 0) + (volume_b or 0)) * inv_steps
+
+
+@lru_cache(maxsize=256)
+def _cached_growth_rates(cytoplasm_volume_change_rate, nuclear_volume_change_rate, fluid_change_rate, cytoplasm_fluid,
+                         cytoplasm_solid, nuclear_fluid, nuclear_solid, dt, phase_duration):
+    """Cached :func:`_growth_rates`, phases built with the same parameters get the rates from a dict lookup"""
+    inv_steps = _inverse_steps(dt, phase_duration)
+    return (_default_rate(cytoplasm_volume_change_rate, cytoplasm_fluid, cytoplasm_solid, inv_steps),
+            _default_rate(nuclear_volume_change_rate, nuclear_fluid, nuclear_solid, inv_steps),
+            _default_rate(fluid_change_rate, cytoplasm_fluid, nuclear_fluid, inv_steps))
+
+
+def _growth_rates(kwargs):
+    """
+    Cytoplasm, nuclear, and fluid change rates of phases that grow the cell (see :func:`_default_rate`), from the
+    phase's keyword arguments.
+
+    :param kwargs: The phase's keyword arguments, defaults included
+    :type kwargs: dict
+    :return: Cytoplasm volume change rate, nuclear volume change rate, fluid change rate
+    :rtype: tuple of float
+    """
+    parameters = (kwargs["cytoplasm_volume_change_rate"], kwargs["nuclear_volume_change_rate"],
+                  kwargs["fluid_change_rate"], kwargs["cytoplasm_fluid"], kwargs["cytoplasm_solid"],
+                  kwargs["nuclear_fluid"], kwargs["nuclear_solid"], kwargs["dt"], kwargs["phase_duration"])
+    try:
+        return _cached_growth_rates(*parameters)
+    except TypeError:  # unhashable parameters (e.g., numpy arrays) can't be cached
+        return _cached_growth_rates.__wrapped__(*parameters)
+
+
+class SenescentPhase(Phase, index=9999, next_phase_index=9999, dt=None, name="senescent", fixed_duration=True,
+                     phase_duration=60 * 24 * 60, cytoplasm_volume_change_rate=0, nuclear_volume_change_rate=0,
+                     calcification_rate=0):
     """
     Default Senescent Phase. Inherits :class:`Phase`
 
@@ -598,43 +952,11 @@ class SenescentPhase(Phase):
 
     """
 
-    def __init__(self, index: int = 9999, previous_phase_index: int = None, next_phase_index: int = 9999,
-                 dt: float = None, time_unit: str = "min", space_unit="micrometer", name: str = "senescent",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = False,
-                 fixed_duration: bool = True, phase_duration: float = 60 * 24 * 60, entry_function=None,
-                 entry_function_args: list = None, exit_function=None, exit_function_args: list = None,
-                 arrest_function=None, arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=0, nuclear_volume_change_rate=0, calcification_rate=0,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit, name=name,
-                         division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-        return
-
-
-class Ki67Negative(Phase):
+    __slots__ = ()
+
+
+class Ki67Negative(Phase, index=0, previous_phase_index=1, next_phase_index=1, name="Ki 67-", fixed_duration=False,
+                   phase_duration=4.59 * 60):
     """
     Inherits :class:`Phase`. Defines Ki 67- quiescent phase.
 
@@ -647,42 +969,11 @@ class Ki67Negative(Phase):
     https://www.ebi.ac.uk/ols/ontologies/bto/terms?iri=http%3A%2F%2Fpurl.obolibrary.org%2Fobo%2FBTO_0001939
     """
 
-    def __init__(self, index: int = 0, previous_phase_index: int = 1, next_phase_index: int = 1, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Ki 67-",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = False,
-                 fixed_duration: bool = False, phase_duration: float = 4.59 * 60, entry_function=None,
-                 entry_function_args: list = None, exit_function=None, exit_function_args: list = None,
-                 arrest_function=None, arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class Ki67Positive(Phase):
+    __slots__ = ()
+
+
+class Ki67Positive(Phase, index=1, previous_phase_index=0, next_phase_index=0, name="Ki 67+",
+                   division_at_phase_exit=True, fixed_duration=True, phase_duration=15.5 * 60.0):
     """
 
     Inherits :class:`Phase`. Defines Ki 67+ proliferating phase.
@@ -701,100 +992,34 @@ class Ki67Positive(Phase):
 
     """
 
-    def __init__(self, index: int = 1, previous_phase_index: int = 0, next_phase_index: int = 0, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Ki 67+",
-                 division_at_phase_exit: bool = True, removal_at_phase_exit: bool = False, fixed_duration: bool = True,
-                 phase_duration: float = 15.5 * 60.0, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        kwargs = {**self._DEFAULTS, **kwargs}
+        entry_function, entry_function_args = kwargs["entry_function"], kwargs["entry_function_args"]
+        exit_function, exit_function_args = kwargs["exit_function"], kwargs["exit_function_args"]
+        cytoplasm_volume_change_rate, nuclear_volume_change_rate, fluid_change_rate = _growth_rates(kwargs)
 
         if entry_function is None:
             entry_function = self._double_target_volume
-            entry_function_args = [None]
-        elif entry_function == False:  # CANNOT BE SIMPLIFIED TO `not entry_function`. Because not None == True
-            pass
-        elif type(entry_function_args) != list and type(entry_function_args) != tuple:
-            raise TypeError("'entry_function' was defined but no valid value for 'entry_function_args' was given. "
-                            "Expected "
-                            f"list or tuple got {type(entry_function_args)}")
+            entry_function_args = _NONE_ARGS
 
         if exit_function == False:  # CANNOT be changed to not exit_function!!! not None => True, None == False => False
             exit_function = None
-            exit_function_args = [None]
+            exit_function_args = _NONE_ARGS
         elif exit_function is None:
             exit_function = self._halve_target_volume
-            exit_function_args = [None]
-        elif type(exit_function_args) != list and type(exit_function_args) != tuple:
-            raise TypeError("'exit_function' was defined but no  valid value for 'entry_function_args' was given. "
-                            "Expected "
-                            f"list or tuple got {type(exit_function_args)}")
-        if cytoplasm_volume_change_rate is None and cytoplasm_fluid is not None and cytoplasm_solid is not None:
-            cytoplasm_volume_change_rate = (cytoplasm_fluid + cytoplasm_solid) / (phase_duration / dt)
-
-        elif cytoplasm_volume_change_rate is None and cytoplasm_fluid is not None:
-            cytoplasm_volume_change_rate = cytoplasm_fluid / (phase_duration / dt)
-
-        elif cytoplasm_volume_change_rate is None and cytoplasm_solid is not None:
-            cytoplasm_volume_change_rate = cytoplasm_solid / (phase_duration / dt)
-
-        elif cytoplasm_volume_change_rate is None:
-            cytoplasm_volume_change_rate = 1
-        else:
-            cytoplasm_volume_change_rate = cytoplasm_volume_change_rate
+            exit_function_args = _NONE_ARGS
 
-        if nuclear_volume_change_rate is None and cytoplasm_fluid is not None and cytoplasm_solid is not None:
-            nuclear_volume_change_rate = (nuclear_fluid + nuclear_solid) / (phase_duration / dt)
+        kwargs.update(entry_function=entry_function, entry_function_args=entry_function_args,
+                      exit_function=exit_function, exit_function_args=exit_function_args,
+                      cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
+                      nuclear_volume_change_rate=nuclear_volume_change_rate, fluid_change_rate=fluid_change_rate)
 
-        elif nuclear_volume_change_rate is None and cytoplasm_fluid is not None:
-            nuclear_volume_change_rate = nuclear_fluid / (phase_duration / dt)
+        super().__init__(**kwargs)
 
-        elif nuclear_volume_change_rate is None and cytoplasm_solid is not None:
-            nuclear_volume_change_rate = nuclear_solid / (phase_duration / dt)
 
-        elif nuclear_volume_change_rate is None:
-            nuclear_volume_change_rate = 1
-        else:
-            nuclear_volume_change_rate = nuclear_volume_change_rate
-
-        if fluid_change_rate is None and cytoplasm_fluid is not None and nuclear_fluid is not None:
-            fluid_change_rate = (cytoplasm_fluid + nuclear_fluid) / (phase_duration / dt)
-        elif fluid_change_rate is None and cytoplasm_fluid is not None:
-            fluid_change_rate = cytoplasm_fluid / (phase_duration / dt)
-        elif fluid_change_rate is None and nuclear_fluid is not None:
-            fluid_change_rate = nuclear_fluid / (phase_duration / dt)
-        else:
-            fluid_change_rate = 1
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class Ki67PositivePreMitotic(Ki67Positive):
+class Ki67PositivePreMitotic(Ki67Positive, next_phase_index=2, name="Ki 67+ pre-mitotic", phase_duration=13.0 * 60.0):
     """
 
     Inherits :class:`Ki67Positive`. Defines Ki 67+ pre-mitotic proliferating phase. Only difference to
@@ -812,46 +1037,18 @@ class Ki67PositivePreMitotic(Ki67Positive):
 
     """
 
-    def __init__(self, index: int = 1, previous_phase_index: int = 0, next_phase_index: int = 2, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Ki 67+ pre-mitotic",
-                 division_at_phase_exit: bool = True, removal_at_phase_exit: bool = False, fixed_duration: bool = True,
-                 phase_duration: float = 13.0 * 60.0, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
-        if entry_function is None:
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        if kwargs.get("entry_function") is None:
             # otherwise it will be defaulted to the halving target volume function by Ki67Positive
-            entry_function = False
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class Ki67PositivePostMitotic(Phase):
+            kwargs["entry_function"] = False
+
+        super().__init__(**kwargs)
+
+
+class Ki67PositivePostMitotic(Phase, index=2, previous_phase_index=1, next_phase_index=0, name="Ki 67+ post-mitotic",
+                              division_at_phase_exit=True, fixed_duration=True, phase_duration=2.5 * 60.0):
     """
     Inherits :class:`Phase`. Defines Ki 67+ post-mitotic phase, it represents the cell's reorganization.
 
@@ -859,7 +1056,7 @@ class Ki67PositivePostMitotic(Phase):
     Transition to the next phase is set to be deterministic (the phase does use a fixed duration) by default. Default
     phase duration is 2.5h. By default, if no user defined custom entry function is defined (i.e.,
     `entry_function=None`), this phase will set its entry function to be
-    :class:`Ki67PositivePostMitotic._standard_Ki67_positive_postmit_entry_function`, which calls
+    :class:`Ki67PositivePostMitotic._standard_Ki67_positive_postmit_entry_function`, an alias of
     :class:`Phase._halve_target_volume`.
 
     The parameters for this phase are based on the MCF-10A cell line
@@ -867,59 +1064,23 @@ class Ki67PositivePostMitotic(Phase):
     https://www.ebi.ac.uk/ols/ontologies/bto/terms?iri=http%3A%2F%2Fpurl.obolibrary.org%2Fobo%2FBTO_0001939
     """
 
-    def __init__(self, index: int = 2, previous_phase_index: int = 1, next_phase_index: int = 0, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Ki 67+ post-mitotic",
-                 division_at_phase_exit: bool = True, removal_at_phase_exit: bool = False, fixed_duration: bool = True,
-                 phase_duration: float = 2.5 * 60.0, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
+    __slots__ = ()
 
-        if entry_function is None:
-            entry_function = self._standard_Ki67_positive_postmit_entry_function
-            entry_function_args = [None]
-        elif type(entry_function_args) != list:
-            raise TypeError("'entry_function' was defined but no value for 'entry_function_args' was given. Expected "
-                            f"list got {type(entry_function_args)}")
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-    def _standard_Ki67_positive_postmit_entry_function(self, *args):
-        """
-        Calls :class:`Phase._halve_target_volume`.
+    def __init__(self, **kwargs):
+        kwargs = {**self._DEFAULTS, **kwargs}
 
-        :param args: Not used
-        :return:
-        """
-        self._halve_target_volume(*args)
+        if kwargs["entry_function"] is None:
+            kwargs["entry_function"] = self._standard_Ki67_positive_postmit_entry_function
+            kwargs["entry_function_args"] = _NONE_ARGS
+
+        super().__init__(**kwargs)
+
+    # the standard entry function is :class:`Phase._halve_target_volume` itself, not a method calling it
+    _standard_Ki67_positive_postmit_entry_function = Phase._halve_target_volume
 
 
-class G0G1(Phase):
+class G0G1(Phase, index=0, previous_phase_index=2, next_phase_index=1, name="G0/G1", fixed_duration=False,
+           phase_duration=5.15 * 60.0):
     """
     Inherits :class:`Phase`. Defines G0/G1 phase, it more representative of the quiescent phase than the first growth
     phase.
@@ -930,42 +1091,11 @@ class G0G1(Phase):
     This phase does not calcify the cell. Reference phase duration from https://www.ncbi.nlm.nih.gov/books/NBK9876/
     """
 
-    def __init__(self, index: int = 0, previous_phase_index: int = 2, next_phase_index: int = 1, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "G0/G1",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = False,
-                 fixed_duration: bool = False, phase_duration: float = 5.15 * 60.0, entry_function=None,
-                 entry_function_args: list = None, exit_function=None, exit_function_args: list = None,
-                 arrest_function=None, arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class S(Phase):
+    __slots__ = ()
+
+
+class S(Phase, index=1, previous_phase_index=0, next_phase_index=2, name="S", fixed_duration=False,
+        phase_duration=8 * 60.0):
     """
     Inherits :class:`Phase`. Defines S phase, it more representative of the growth phase than the inter-growth rest.
 
@@ -976,88 +1106,25 @@ class S(Phase):
     https://www.ncbi.nlm.nih.gov/books/NBK9876/
     """
 
-    def __init__(self, index: int = 1, previous_phase_index: int = 0, next_phase_index: int = 2, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "S", division_at_phase_exit: bool = False,
-                 removal_at_phase_exit: bool = False, fixed_duration: bool = False, phase_duration: float = 8 * 60.0,
-                 entry_function=None, entry_function_args: list = None, exit_function=None,
-                 exit_function_args: list = None, arrest_function=None, arrest_function_args: list = None,
-                 check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None,
-                 simulated_cell_volume: float = None, cytoplasm_volume_change_rate=None,
-                 nuclear_volume_change_rate=None, calcification_rate=None, target_fluid_fraction=None,
-                 nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None, cytoplasm_fluid=None,
-                 cytoplasm_solid=None, cytoplasm_solid_target=None, target_cytoplasm_to_nuclear_ratio=None,
-                 calcified_fraction=None, fluid_change_rate=None, relative_rupture_volume=None,
-                 user_phase_time_step=None, user_phase_time_step_args=None):
+    __slots__ = ()
 
-        if entry_function is None:
-            entry_function = self._double_target_volume
-            entry_function_args = [None]
-        elif type(entry_function_args) != list:
-            raise TypeError("'entry_function' was defined but no value for 'entry_function_args' was given. Expected "
-                            f"list got {type(entry_function_args)}")
+    def __init__(self, **kwargs):
+        kwargs = {**self._DEFAULTS, **kwargs}
 
-        if cytoplasm_volume_change_rate is None and cytoplasm_fluid is not None and cytoplasm_solid is not None:
-            cytoplasm_volume_change_rate = (cytoplasm_fluid + cytoplasm_solid) / (phase_duration / dt)
+        if kwargs["entry_function"] is None:
+            kwargs["entry_function"] = self._double_target_volume
+            kwargs["entry_function_args"] = _NONE_ARGS
 
-        elif cytoplasm_volume_change_rate is None and cytoplasm_fluid is not None:
-            cytoplasm_volume_change_rate = cytoplasm_fluid / (phase_duration / dt)
+        cytoplasm_volume_change_rate, nuclear_volume_change_rate, fluid_change_rate = _growth_rates(kwargs)
 
-        elif cytoplasm_volume_change_rate is None and cytoplasm_solid is not None:
-            cytoplasm_volume_change_rate = cytoplasm_solid / (phase_duration / dt)
+        kwargs.update(cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
+                      nuclear_volume_change_rate=nuclear_volume_change_rate, fluid_change_rate=fluid_change_rate)
 
-        elif cytoplasm_volume_change_rate is None:
-            cytoplasm_volume_change_rate = 1
-        else:
-            cytoplasm_volume_change_rate = cytoplasm_volume_change_rate
+        super().__init__(**kwargs)
 
-        if nuclear_volume_change_rate is None and cytoplasm_fluid is not None and cytoplasm_solid is not None:
-            nuclear_volume_change_rate = (nuclear_fluid + nuclear_solid) / (phase_duration / dt)
 
-        elif nuclear_volume_change_rate is None and cytoplasm_fluid is not None:
-            nuclear_volume_change_rate = nuclear_fluid / (phase_duration / dt)
-
-        elif nuclear_volume_change_rate is None and cytoplasm_solid is not None:
-            nuclear_volume_change_rate = nuclear_solid / (phase_duration / dt)
-
-        elif nuclear_volume_change_rate is None:
-            nuclear_volume_change_rate = 1
-        else:
-            nuclear_volume_change_rate = nuclear_volume_change_rate
-
-        if fluid_change_rate is None and cytoplasm_fluid is not None and nuclear_fluid is not None:
-            fluid_change_rate = (cytoplasm_fluid + nuclear_fluid) / (phase_duration / dt)
-        elif fluid_change_rate is None and cytoplasm_fluid is not None:
-            fluid_change_rate = cytoplasm_fluid / (phase_duration / dt)
-        elif fluid_change_rate is None and nuclear_fluid is not None:
-            fluid_change_rate = nuclear_fluid / (phase_duration / dt)
-        else:
-            fluid_change_rate = 1
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class G2M(Phase):
+class G2M(Phase, index=2, previous_phase_index=1, next_phase_index=0, name="G2/M", division_at_phase_exit=True,
+          fixed_duration=False, phase_duration=5 * 60.0):
     """
     Inherits :class:`Phase`. Defines G2M phase, it more representative of the mitosis phase than the growth.
 
@@ -1068,55 +1135,22 @@ class G2M(Phase):
     https://www.ncbi.nlm.nih.gov/books/NBK9876/
     """
 
-    def __init__(self, index: int = 2, previous_phase_index: int = 1, next_phase_index: int = 0, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "G2/M",
-                 division_at_phase_exit: bool = True, removal_at_phase_exit: bool = False, fixed_duration: bool = False,
-                 phase_duration: float = 5 * 60.0, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate=None, nuclear_volume_change_rate=None, calcification_rate=None,
-                 target_fluid_fraction=None, nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None,
-                 cytoplasm_fluid=None, cytoplasm_solid=None, cytoplasm_solid_target=None,
-                 target_cytoplasm_to_nuclear_ratio=None, calcified_fraction=None, fluid_change_rate=None,
-                 relative_rupture_volume=None, user_phase_time_step=None, user_phase_time_step_args=None):
+    __slots__ = ()
 
-        if entry_function is not None and type(entry_function_args) != list and type(entry_function_args) != tuple:
-            raise TypeError("'entry_function' was defined but no valid value for 'entry_function_args' was given. "
-                            "Expected "
-                            f"list or tuple got {type(entry_function_args)}")
-        if exit_function is None:
-            exit_function = self._halve_target_volume
-            exit_function_args = [None]
-        elif type(exit_function_args) != list and type(exit_function_args) != tuple:
-            raise TypeError("'exit_function' was defined but no  valid value for 'entry_function_args' was given. "
-                            "Expected "
-                            f"list or tuple got {type(exit_function_args)}")
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
-
-
-class Apoptosis(Phase):
+    def __init__(self, **kwargs):
+        kwargs = {**self._DEFAULTS, **kwargs}
+
+        if kwargs["exit_function"] is None:
+            kwargs["exit_function"] = self._halve_target_volume
+            kwargs["exit_function_args"] = _NONE_ARGS
+
+        super().__init__(**kwargs)
+
+
+class Apoptosis(Phase, index=0, previous_phase_index=0, next_phase_index=0, name="Apoptosis",
+                removal_at_phase_exit=True, fixed_duration=True, phase_duration=8.6 * 60.0,
+                cytoplasm_volume_change_rate=1 / 60, nuclear_volume_change_rate=0.35 / 60, calcification_rate=0,
+                relative_rupture_volume=2, fluid_change_rate=3 / 60):
     """
     Inherits :class:`Phase`. Defines apoptotic phenotype phase.
 
@@ -1130,55 +1164,17 @@ class Apoptosis(Phase):
     the cell.
     """
 
-    def __init__(self, index: int = 0, previous_phase_index: int = 0, next_phase_index: int = 0, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Apoptosis",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = True, fixed_duration: bool = True,
-                 phase_duration: float = 8.6 * 60.0, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate: float = 1 / 60, nuclear_volume_change_rate: float = 0.35 / 60,
-                 calcification_rate: float = 0, relative_rupture_volume: float = 2, target_fluid_fraction=None,
-                 nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None, cytoplasm_fluid=None,
-                 cytoplasm_solid=None, cytoplasm_solid_target=None, target_cytoplasm_to_nuclear_ratio=None,
-                 calcified_fraction=None, fluid_change_rate=3 / 60, user_phase_time_step=None,
-                 user_phase_time_step_args=None):
+    __slots__ = ()
 
-        if entry_function is None:
-            entry_function = self._standard_apoptosis_entry
-            entry_function_args = [None]
+    def __init__(self, **kwargs):
+        kwargs = _with_defaults(self._DEFAULTS, kwargs,
+                                none_to_default=("fluid_change_rate", "relative_rupture_volume"))
 
-        if fluid_change_rate is not None:
-            self.fluid_change_rate = fluid_change_rate
-        else:
-            self.fluid_change_rate = 3 / 60
+        if kwargs["entry_function"] is None:
+            kwargs["entry_function"] = self._standard_apoptosis_entry
+            kwargs["entry_function_args"] = _NONE_ARGS
 
-        if relative_rupture_volume is None:
-            self.relative_rupture_volume = 2
-        else:
-            self.relative_rupture_volume = relative_rupture_volume
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
+        super().__init__(**kwargs)
 
     def _standard_apoptosis_entry(self, *none):
         """
@@ -1188,13 +1184,17 @@ class Apoptosis(Phase):
         :return:
         """
 
+        volume = self.volume
         # shrink cell
-        self.volume.target_fluid_fraction = 0
-        self.volume.cytoplasm_solid_target = 0
-        self.volume.nuclear_solid_target = 0
+        volume.target_fluid_fraction = 0
+        volume.cytoplasm_solid_target = 0
+        volume.nuclear_solid_target = 0
 
 
-class NecrosisSwell(Phase):
+class NecrosisSwell(Phase, index=0, previous_phase_index=0, next_phase_index=1, name="Necrotic (swelling)",
+                    fixed_duration=False, phase_duration=9e99, cytoplasm_volume_change_rate=0.0032 / 60.0,
+                    nuclear_volume_change_rate=0.013 / 60.0, fluid_change_rate=0.67 / 60.0,
+                    calcification_rate=0.0042 / 60.0, relative_rupture_volume=2):
     """
     Inherits :class:`Phase`. Swelling part of the necrosis process.
 
@@ -1211,79 +1211,21 @@ class NecrosisSwell(Phase):
     `calcification_rate = 0.0042 / 60.0`. This phase does calcify the cell.
     """
 
-    def __init__(self, index: int = 0, previous_phase_index: int = 0, next_phase_index: int = 1, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Necrotic (swelling)",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = False,
-                 fixed_duration: bool = False, phase_duration: float = None, entry_function=None,
-                 entry_function_args: list = None, exit_function=None, exit_function_args: list = None,
-                 arrest_function=None, arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate: float = None, nuclear_volume_change_rate: float = None,
-                 calcification_rate: float = None, relative_rupture_volume: float = None, target_fluid_fraction=None,
-                 nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None, cytoplasm_fluid=None,
-                 cytoplasm_solid=None, cytoplasm_solid_target=None, target_cytoplasm_to_nuclear_ratio=None,
-                 calcified_fraction=None, fluid_change_rate=None, user_phase_time_step=None,
-                 user_phase_time_step_args=None):
-
-        # default parameters
-
-        # this phase will use by default a custom transition check, so this is here to avoid issues
-        _phase_duration = 9e99
-
-        # default volume parameters
-        _cytoplasm_volume_change_rate = 0.0032 / 60.0
-        _nuclear_volume_change_rate = 0.013 / 60.0
-        _fluid_change_rate = 0.67 / 60.0
-        _calcification_rate = 0.0042 / 60.0
-        _relative_rupture_volume = 2
+    __slots__ = ()
 
-        if phase_duration is None:
-            phase_duration = _phase_duration
+    def __init__(self, **kwargs):
+        # this phase will use by default a custom transition check, the (huge) phase duration is here to avoid issues
+        kwargs = _with_defaults(self._DEFAULTS, kwargs, _NECROSIS_NONE_DEFAULTS)
 
-        if cytoplasm_volume_change_rate is None:
-            cytoplasm_volume_change_rate = _cytoplasm_volume_change_rate
+        if kwargs["entry_function"] is None:
+            kwargs["entry_function"] = self._standard_necrosis_entry_function
+            kwargs["entry_function_args"] = _NONE_ARGS
 
-        if nuclear_volume_change_rate is None:
-            nuclear_volume_change_rate = _nuclear_volume_change_rate
+        if kwargs["check_transition_to_next_phase_function"] is None:
+            kwargs["check_transition_to_next_phase_function"] = self._necrosis_transition_function
+            kwargs["check_transition_to_next_phase_function_args"] = _NONE_ARGS
 
-        if fluid_change_rate is None:
-            fluid_change_rate = _fluid_change_rate
-
-        if calcification_rate is None:
-            calcification_rate = _calcification_rate
-
-        if relative_rupture_volume is None:
-            relative_rupture_volume = _relative_rupture_volume
-
-        if entry_function is None:
-            entry_function = self._standard_necrosis_entry_function
-            entry_function_args = [None]
-
-        if check_transition_to_next_phase_function is None:
-            check_transition_to_next_phase_function = self._necrosis_transition_function
-            check_transition_to_next_phase_function_args = [None]
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit,
-                         name=name, division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
+        super().__init__(**kwargs)
 
     def _standard_necrosis_entry_function(self, *none):
         """
@@ -1295,16 +1237,17 @@ class NecrosisSwell(Phase):
         :return: No return
         """
 
+        volume = self.volume
         # the cell wants to degrade the solids and swell by osmosis
-        self.volume.target_fluid_fraction = 1
-        self.volume.nuclear_solid_target = 0
-        self.volume.cytoplasm_solid_target = 0
+        volume.target_fluid_fraction = 1
+        volume.nuclear_solid_target = 0
+        volume.cytoplasm_solid_target = 0
 
-        self.volume.target_cytoplasm_to_nuclear_ratio = 0
+        volume.target_cytoplasm_to_nuclear_ratio = 0
 
         # set rupture volume
 
-        self.volume.rupture_volume = self.volume.relative_rupture_volume * self.volume.total
+        volume.rupture_volume = volume.relative_rupture_volume * volume.total
 
     def _necrosis_transition_function(self, *none):
         """
@@ -1316,8 +1259,28 @@ class NecrosisSwell(Phase):
         """
         return self.volume.total > self.volume.rupture_volume
 
+    @staticmethod
+    def batch_transition(total, rupture_volume, out=None):
+        """
+        Vectorized :func:`_necrosis_transition_function`: the rupture check of many cells at once, with one ufunc
+        call.
+
+        :param total: Total volume of each cell
+        :type total: numpy.ndarray
+        :param rupture_volume: Rupture volume of each cell (or one for all)
+        :type rupture_volume: float or numpy.ndarray
+        :param out: Array (bool) to write the flags to. If None, a new one is made
+        :type out: numpy.ndarray or None
+        :return: Flags (bool), one per cell, for the transition to the next phase
+        :rtype: numpy.ndarray
+        """
+        return greater(total, rupture_volume, out=out)
+
 
-class NecrosisLysed(Phase):
+class NecrosisLysed(Phase, index=1, previous_phase_index=0, next_phase_index=-1, name="Necrotic (lysed)",
+                    removal_at_phase_exit=True, fixed_duration=True, phase_duration=60 * 60 * 24,
+                    cytoplasm_volume_change_rate=0.0032 / 60.0, nuclear_volume_change_rate=0.013 / 60.0,
+                    fluid_change_rate=0.050 / 60.0, calcification_rate=0.0042 / 60.0, relative_rupture_volume=9e99):
     """
     Inherits :class:`Phase`. Ruptured necrotic cell
 
@@ -1333,74 +1296,18 @@ class NecrosisLysed(Phase):
 
     """
 
-    def __init__(self, index: int = 1, previous_phase_index: int = 0, next_phase_index: int = -1, dt: float = 0.1,
-                 time_unit: str = "min", space_unit="micrometer", name: str = "Necrotic (lysed)",
-                 division_at_phase_exit: bool = False, removal_at_phase_exit: bool = True, fixed_duration: bool = True,
-                 phase_duration: float = None, entry_function=None, entry_function_args: list = None,
-                 exit_function=None, exit_function_args: list = None, arrest_function=None,
-                 arrest_function_args: list = None, check_transition_to_next_phase_function=None,
-                 check_transition_to_next_phase_function_args: list = None, simulated_cell_volume: float = None,
-                 cytoplasm_volume_change_rate: float = None, nuclear_volume_change_rate: float = None,
-                 calcification_rate: float = None, relative_rupture_volume: float = None, target_fluid_fraction=None,
-                 nuclear_fluid=None, nuclear_solid=None, nuclear_solid_target=None, cytoplasm_fluid=None,
-                 cytoplasm_solid=None, cytoplasm_solid_target=None, target_cytoplasm_to_nuclear_ratio=None,
-                 calcified_fraction=None, fluid_change_rate=None, user_phase_time_step=None,
-                 user_phase_time_step_args=None):
-
-        # default parameters
-
-        _phase_duration = 60 * 60 * 24  # 60 days, the cell should disappear naturally before then,
-        # but if it hasn't we do it
-
-        _cytoplasm_volume_change_rate = 0.0032 / 60.0
-        _nuclear_volume_change_rate = 0.013 / 60.0
-        _fluid_change_rate = 0.050 / 60.0
-        _calcification_rate = 0.0042 / 60.0
-        _relative_rupture_volume = 9e99
+    __slots__ = ()
 
-        if phase_duration is None:
-            phase_duration = _phase_duration
+    def __init__(self, **kwargs):
+        # the 60 days phase duration is a safeguard, the cell should disappear naturally before then, but if it hasn't
+        # we do it
+        kwargs = _with_defaults(self._DEFAULTS, kwargs, _NECROSIS_NONE_DEFAULTS)
 
-        if cytoplasm_volume_change_rate is None:
-            cytoplasm_volume_change_rate = _cytoplasm_volume_change_rate
-
-        if nuclear_volume_change_rate is None:
-            nuclear_volume_change_rate = _nuclear_volume_change_rate
+        if kwargs["entry_function"] is None:
+            kwargs["entry_function"] = self._standard_lysis_entry_function
+            kwargs["entry_function_args"] = _NONE_ARGS
 
-        if fluid_change_rate is None:
-            fluid_change_rate = _fluid_change_rate
-
-        if calcification_rate is None:
-            calcification_rate = _calcification_rate
-
-        if relative_rupture_volume is None:
-            relative_rupture_volume = _relative_rupture_volume
-
-        if entry_function is None:
-            entry_function = self._standard_lysis_entry_function
-            entry_function_args = [None]
-
-        super().__init__(index=index, previous_phase_index=previous_phase_index, next_phase_index=next_phase_index,
-                         dt=dt, time_unit=time_unit, space_unit=space_unit, name=name,
-                         division_at_phase_exit=division_at_phase_exit,
-                         removal_at_phase_exit=removal_at_phase_exit, fixed_duration=fixed_duration,
-                         phase_duration=phase_duration, entry_function=entry_function,
-                         entry_function_args=entry_function_args, exit_function=exit_function,
-                         exit_function_args=exit_function_args, arrest_function=arrest_function,
-                         arrest_function_args=arrest_function_args,
-                         check_transition_to_next_phase_function=check_transition_to_next_phase_function,
-                         check_transition_to_next_phase_function_args=check_transition_to_next_phase_function_args,
-                         simulated_cell_volume=simulated_cell_volume,
-                         cytoplasm_volume_change_rate=cytoplasm_volume_change_rate,
-                         nuclear_volume_change_rate=nuclear_volume_change_rate, calcification_rate=calcification_rate,
-                         target_fluid_fraction=target_fluid_fraction, nuclear_fluid=nuclear_fluid,
-                         nuclear_solid=nuclear_solid, nuclear_solid_target=nuclear_solid_target,
-                         cytoplasm_fluid=cytoplasm_fluid, cytoplasm_solid=cytoplasm_solid,
-                         cytoplasm_solid_target=cytoplasm_solid_target,
-                         target_cytoplasm_to_nuclear_ratio=target_cytoplasm_to_nuclear_ratio,
-                         calcified_fraction=calcified_fraction, fluid_change_rate=fluid_change_rate,
-                         relative_rupture_volume=relative_rupture_volume, user_phase_time_step=user_phase_time_step,
-                         user_phase_time_step_args=user_phase_time_step_args)
+        super().__init__(**kwargs)
 
     def _standard_lysis_entry_function(self, *none):
         """
@@ -1408,15 +1315,16 @@ class NecrosisLysed(Phase):
         :param none: Not used. This is a custom entry function, therefore it has to have args
         :return:
         """
-        self.volume.target_fluid_fraction = 0
-        self.volume.nuclear_solid_target = 0
-        self.volume.cytoplasm_solid_target = 0
+        volume = self.volume
+        volume.target_fluid_fraction = 0
+        volume.nuclear_solid_target = 0
+        volume.cytoplasm_solid_target = 0
 
-        self.volume.target_cytoplasm_to_nuclear_ratio = 0
+        volume.target_cytoplasm_to_nuclear_ratio = 0
 
         # set rupture volume
 
-        self.volume.rupture_volume = self.volume.relative_rupture_volume * self.volume.total
+        volume.rupture_volume = volume.relative_rupture_volume * volume.total
 
 
 def main():
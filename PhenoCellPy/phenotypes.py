@@ -640,8 +640,8 @@ class SimpleLiveCycle(Phenotype):
     #              user_phases_time_step_args=None, phase_durations=[60 / 0.0432], fixed_durations=[None],
     #              cytoplasm_volume_change_rate=(None,)):
         if user_phases_time_step is None:
-            user_phases_time_step = [None]
-            user_phases_time_step_args = [None]
+            user_phases_time_step = (None,)
+            user_phases_time_step_args = (None,)
 
         phases = [
             Phases.Phase(index=0, previous_phase_index=0, next_phase_index=0, dt=dt, time_unit=time_unit,
@@ -650,7 +650,7 @@ class SimpleLiveCycle(Phenotype):
                          user_phase_time_step=user_phases_time_step[0],
                          user_phase_time_step_args=user_phases_time_step_args[0], fixed_duration=fixed_durations[0],
                          cytoplasm_volume_change_rate=cytoplasm_volume_change_rate[0],
-                         removal_at_phase_exit=removal_at_phase_exits, entry_function=entry_functions[0],
+                         removal_at_phase_exit=removal_at_phase_exits[0], entry_function=entry_functions[0],
                          entry_function_args=entry_functions_args[0], exit_function=exit_functions[0],
                          exit_function_args=exit_functions_args[0], arrest_function=arrest_functions[0],
                          arrest_function_args=arrest_functions_args[0],
@@ -699,8 +699,8 @@ class Ki67Basic(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = [None, None]
-            user_phases_time_step_args = [None, None]
+            user_phases_time_step = (None, None)
+            user_phases_time_step_args = (None, None)
         _check_arguments(2, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -810,8 +810,8 @@ class Ki67Advanced(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = [None, None, None]
-            user_phases_time_step_args = [None, None, None]
+            user_phases_time_step = (None, None, None)
+            user_phases_time_step_args = (None, None, None)
         _check_arguments(3, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -960,8 +960,8 @@ class FlowCytometryBasic(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = [None, None, None]
-            user_phases_time_step_args = [None, None, None]
+            user_phases_time_step = (None, None, None)
+            user_phases_time_step_args = (None, None, None)
         _check_arguments(3, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -1082,8 +1082,8 @@ class FlowCytometryAdvanced(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = len(phase_durations) * [None]
-            user_phases_time_step_args = len(phase_durations) * [None]
+            user_phases_time_step = len(phase_durations) * (None,)
+            user_phases_time_step_args = len(phase_durations) * (None,)
         _check_arguments(4, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -1215,8 +1215,8 @@ class ApoptosisStandard(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = len(phase_durations) * [None]
-            user_phases_time_step_args = len(phase_durations) * [None]
+            user_phases_time_step = len(phase_durations) * (None,)
+            user_phases_time_step_args = len(phase_durations) * (None,)
         _check_arguments(1, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -1296,8 +1296,8 @@ class NecrosisStandard(Phenotype):
                  user_phenotype_time_step=None, user_phenotype_time_step_args=None, user_phases_time_step=None,
                  user_phases_time_step_args=None):
         if user_phases_time_step is None:
-            user_phases_time_step = len(phase_durations) * [None]
-            user_phases_time_step_args = len(phase_durations) * [None]
+            user_phases_time_step = len(phase_durations) * (None,)
+            user_phases_time_step_args = len(phase_durations) * (None,)
         _check_arguments(2, name, division_at_phase_exits, removal_at_phase_exits, fixed_durations, phase_durations,
                          entry_functions, entry_functions_args, exit_functions, exit_functions_args, arrest_functions,
                          arrest_functions_args, check_transition_to_next_phase_functions,
@@ -1409,6 +1409,8 @@ def get_phenotype_by_name(name):
 
 
 if __name__ == "__main__":
+    from math import expm1
+
     import numpy as np
 
     dt = 1
@@ -1485,7 +1487,7 @@ if __name__ == "__main__":
         phase_duration = args[1]
         total = args[2]
         total_target = args[3]
-        time_check = np.random.uniform() < (1 - np.exp(-dt / phase_duration))
+        time_check = np.random.uniform() < -expm1(-dt / phase_duration)
         volume_check = total <= 1.1 * total_target
         return time_check and volume_check
 
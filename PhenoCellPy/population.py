@@ -0,0 +1,375 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2023, Juliano Ferrari Gianlupi
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+from numbers import Integral
+
+from numpy import array, empty, equal, expm1, flatnonzero, float32, float64, inf, ndarray, ones, take, uint8, where, \
+    zeros
+from numpy.random import default_rng
+
+import PhenoCellPy.phases as Phases
+from PhenoCellPy._phase_kernels import VOLUME_FIELDS, volume_dtype, step_cohort, double_target_volume, \
+    halve_target_volume
+
+
+def _unbound(function):
+    """Returns the plain function behind a bound method, or `function` itself"""
+    return getattr(function, "__func__", function)
+
+
+# floating point types of the per-cell arrays
+_PRECISIONS = {"f32": float32, "f64": float64}
+
+# bits of the state codes returned by PhasePopulation.time_step_population_codes
+PHASE_CHANGED = 1
+CELL_REMOVED = 2
+CELL_DIVIDES = 4
+
+# rows of the volumes that Phenotype.set_phase copies from the phase a cell leaves to the phase it enters
+_CARRIED_VOLUMES = array([VOLUME_FIELDS.index(name) for name in (
+    "cytoplasm_solid", "cytoplasm_fluid", "nuclear_solid", "nuclear_fluid", "calcified_fraction",
+    "cytoplasm_solid_target", "nuclear_solid_target", "target_fluid_fraction")])
+
+# phase entry and exit functions that have a batch counterpart, called as `batch_function(volumes, cells)`
+_BATCH_PHASE_FUNCTIONS = {
+    Phases.Phase._double_target_volume: double_target_volume,
+    Phases.Phase._halve_target_volume: halve_target_volume}
+
+
+class PhasePopulation:
+    """
+    Time-steps one phenotype model for a whole population of cells at once.
+
+    A :class:`PhenoCellPy.phenotypes.Phenotype` keeps the state of a single cell in python objects, so a simulation of
+    N cells makes N python calls to :func:`Phenotype.time_step_phenotype` per time-step. This class keeps the state of
+    every cell in numpy arrays (one entry per cell) and time-steps all of them in one call, using the kernels of
+    :mod:`PhenoCellPy._phase_kernels` (compiled with numba if it is installed). The phases of the phenotype are used as
+    templates, their parameters (durations, rates, next phase, flags) are read once at initialization.
+
+    As in a :class:`PhenoCellPy.phenotypes.Phenotype`, where each phase has its own
+    :class:`PhenoCellPy.cell_volume.CellVolumes`, each cell keeps one set of volumes per phase. When a cell changes
+    phase only the volumes :func:`Phenotype.set_phase` copies (the fluid and solid volumes, their targets, and the
+    calcified fraction) are carried over; the others (e.g., the total volume) are the ones the cell had the last time
+    it was in the phase it enters, until its next volume update.
+
+    The per-cell arrays can be stored in single precision (`precision="f32"`), halving their memory footprint and
+    doubling how many cells fit in a SIMD register. Biological parameters are seldom known to better than a few
+    percent, so single precision is usually enough; the default is double precision.
+
+    Only phases using the default transition functions (:func:`Phase._check_transition_to_next_phase_deterministic`
+    and :func:`Phase._check_transition_to_next_phase_stochastic`), no arrest or user-defined functions, and entry and
+    exit functions with a batch counterpart (:func:`Phase._double_target_volume` and :func:`Phase._halve_target_volume`,
+    the latter being also the standard Ki67+ post-mitotic entry function) are supported. The entry and exit functions
+    are applied, once per time-step, to all the cells that entered or left the phase.
+
+    Methods:
+    --------
+
+    time_step_population()
+        Time-steps every cell. Returns a tuple of boolean arrays (cell changed phases, cell died, cell divided), one
+        entry per cell. See :func:`Phenotype.time_step_phenotype`.
+
+    time_step_population_codes()
+        Time-steps every cell. Returns the same flags packed in one uint8 code per cell, see `PHASE_CHANGED`,
+        `CELL_REMOVED`, and `CELL_DIVIDES`
+
+    phase(cell)
+        Phase (of the phenotype) cell `cell` is in
+
+    volume(name)
+        Volume `name` (e.g., "total") of every cell
+
+    Attributes
+    ----------
+
+    phenotype : :class:`PhenoCellPy.phenotypes.Phenotype`
+        Phenotype model used as template
+
+    number_of_cells : int
+        How many cells are in the population
+
+    dt : float
+        Time-step size (in units of `phenotype.time_unit`)
+
+    dtype : numpy.dtype
+        Floating point type of the per-cell arrays, set by `precision`
+
+    phase_index : numpy.ndarray of int
+        Index (in `phenotype.phases`) of the current phase of each cell
+
+    time_in_phase : numpy.ndarray of float
+        Time each cell has spent in its current phase
+
+    volumes : numpy.ndarray of float
+        Volumes of the cells, one row per name in :data:`PhenoCellPy._phase_kernels.VOLUME_FIELDS`, one column per cell
+
+    cell_volumes : numpy.ndarray
+        Structured view of :attr:`volumes` (0-d, one field per volume name), e.g., `cell_volumes["total"][cells] *= 2`
+
+    time_in_population : float
+        Total time elapsed for the population
+    """
+
+    __slots__ = ("phenotype", "number_of_cells", "dt", "dtype", "phase_duration", "fixed_duration",
+                 "transition_probability", "next_phase_index", "division_at_phase_exit", "removal_at_phase_exit",
+                 "rates", "phase_index", "time_in_phase", "volumes", "cell_volumes", "time_in_population", "rng",
+                 "_phase_duration", "_transition_probability", "_stochastic", "_no_draws", "_entry_functions",
+                 "_exit_functions", "_volume_slot", "_phase_volumes", "_transition_mask", "_removal_mask",
+                 "_division_mask", "_enter_mask", "_state_codes")
+
+    def __init__(self, phenotype, number_of_cells: int, seed=None, precision: str = "f64"):
+        """
+        :param phenotype: Phenotype model every cell of the population follows
+        :type phenotype: :class:`PhenoCellPy.phenotypes.Phenotype`
+        :param number_of_cells: How many cells are in the population
+        :type number_of_cells: int
+        :param seed: Seed for the random number generator of the stochastic transitions
+        :type seed: int or None
+        :param precision: Floating point precision of the per-cell arrays, "f32" (single) or "f64" (double)
+        :type precision: str
+        """
+        if not isinstance(number_of_cells, Integral) or number_of_cells < 0:
+            raise ValueError(f"`number_of_cells` must be an int >= 0. Got {number_of_cells}")
+        if precision not in _PRECISIONS:
+            raise ValueError(f"`precision` must be one of {tuple(_PRECISIONS)}. Got {precision}")
+        if phenotype.user_phenotype_time_step is not None:
+            raise ValueError(f"{phenotype.name}: `user_phenotype_time_step` is not supported by PhasePopulation")
+
+        phases = phenotype.phases
+        number_of_phases = len(phases)
+
+        self.phenotype = phenotype
+        self.number_of_cells = number_of_cells = int(number_of_cells)
+        # a float, so that integer and float time-steps share one compilation of the kernels
+        self.dt = float(phenotype.dt)
+        self.dtype = _PRECISIONS[precision]
+
+        for phase in phases:
+            self._check_phase(phase, number_of_phases)
+        specs = [phase.spec for phase in phases]
+
+        self.phase_duration = array([spec.phase_duration for spec in specs], dtype=float)
+        self.fixed_duration = array([_unbound(phase.check_transition_to_next_phase_function) is
+                                     Phases.Phase._check_transition_to_next_phase_deterministic for phase in phases])
+        # fixed for the whole simulation, no need to calculate it every step. The division is done in double precision,
+        # only the result is stored in the population's precision
+        self.transition_probability = (-expm1(-self.dt / self.phase_duration)).astype(self.dtype)
+        # python-like indexing, so that next_phase_index=-1 is the last phase as in Phenotype.set_phase
+        self.next_phase_index = array([spec.next_phase_index % number_of_phases for spec in specs], dtype=int)
+        self.division_at_phase_exit = array([bool(spec.division_at_phase_exit) for spec in specs])
+        self.removal_at_phase_exit = array([bool(spec.removal_at_phase_exit) for spec in specs])
+        # PhaseRates fields are in the order of the kernels' RATE_FIELDS, one row per rate, one column per phase
+        self.rates = array([phase.rates for phase in phases], dtype=self.dtype).T.copy()
+        # the kernel checks both transition rules for every cell: deterministic phases get a probability of 0 and
+        # stochastic phases an infinite duration
+        self._phase_duration = where(self.fixed_duration, self.phase_duration, inf)
+        self._transition_probability = where(self.fixed_duration, 0, self.transition_probability).astype(self.dtype)
+        # deterministic transitions are a comparison against `phase_duration` inside the kernel, when there are no
+        # stochastic phases there is no need to draw random numbers. Draws of 1 never trigger a stochastic transition
+        self._stochastic = not self.fixed_duration.all()
+        self._no_draws = ones(0 if self._stochastic else number_of_cells, dtype=self.dtype)
+        self._entry_functions = [(index, _BATCH_PHASE_FUNCTIONS[_unbound(phase.entry_function)])
+                                 for index, phase in enumerate(phases) if phase.entry_function]
+        self._exit_functions = [(index, _BATCH_PHASE_FUNCTIONS[_unbound(phase.exit_function)])
+                                for index, phase in enumerate(phases) if phase.exit_function]
+
+        self.phase_index = zeros(number_of_cells, dtype=int)
+        self.phase_index[:] = phases.index(phenotype.current_phase)
+        self.time_in_phase = zeros(number_of_cells, dtype=self.dtype)
+        self.time_in_phase[:] = phenotype.current_phase.time_in_phase
+        self.volumes = empty((len(VOLUME_FIELDS), number_of_cells), dtype=self.dtype)
+        self.volumes[:] = array([getattr(phenotype.current_phase.volume, name) for name in VOLUME_FIELDS])[:, None]
+        # the same memory, with the volumes accessible by name
+        self.cell_volumes = ndarray((), dtype=volume_dtype(number_of_cells, self.dtype), buffer=self.volumes)
+        # volumes of each cell in the phases it is not in, one (VOLUME_FIELDS, cells) block per phase. Phases sharing a
+        # CellVolumes object share a block, the index of the block of each phase is in `_volume_slot`
+        volume_ids = [id(phase.volume) for phase in phases]
+        self._volume_slot = array([volume_ids.index(volume_id) for volume_id in volume_ids], dtype=int)
+        self._phase_volumes = empty((number_of_phases, len(VOLUME_FIELDS), number_of_cells), dtype=self.dtype)
+        for index, phase in enumerate(phases):
+            self._phase_volumes[index] = array([getattr(phase.volume, name) for name in VOLUME_FIELDS])[:, None]
+        self.time_in_population = 0
+
+        # allocated once, the masks are rewritten every time-step
+        self._transition_mask = empty(number_of_cells, dtype=bool)
+        self._removal_mask = empty(number_of_cells, dtype=bool)
+        self._division_mask = empty(number_of_cells, dtype=bool)
+        self._enter_mask = empty(number_of_cells, dtype=bool)
+        self._state_codes = empty(number_of_cells, dtype=uint8)
+
+        self.rng = default_rng(seed)
+
+    def _check_phase(self, phase, number_of_phases):
+        """Raises ValueError if `phase` can't be time-stepped by the population kernels"""
+        spec = phase.spec
+        transition = _unbound(phase.check_transition_to_next_phase_function)
+        if transition is not Phases.Phase._check_transition_to_next_phase_deterministic and \
+                transition is not Phases.Phase._check_transition_to_next_phase_stochastic:
+            raise ValueError(f"{spec.name}: custom transition functions are not supported by PhasePopulation")
+        for function in ("entry_function", "exit_function"):
+            if getattr(phase, function) and _unbound(getattr(phase, function)) not in _BATCH_PHASE_FUNCTIONS:
+                raise ValueError(f"{spec.name}: `{function}` has no batch counterpart, it is not supported by "
+                                 f"PhasePopulation")
+        for function in ("arrest_function", "user_phase_time_step"):
+            if getattr(phase, function):
+                raise ValueError(f"{spec.name}: `{function}` is not supported by PhasePopulation")
+        if spec.dt != self.dt:
+            raise ValueError(f"{spec.name}: phase dt ({spec.dt}) differs from the phenotype dt ({self.dt})")
+        if not -number_of_phases <= spec.next_phase_index < number_of_phases:
+            raise ValueError(f"{spec.name}: next phase index {spec.next_phase_index} is out of bounds for "
+                             f"{number_of_phases} phases")
+
+    def time_step_population(self):
+        """
+        Time-steps every cell of the population.
+
+        Increments :attr:`time_in_population` by :attr:`dt`. Updates the time in phase and the volumes of every cell
+        and checks for phase transitions (see :func:`PhenoCellPy._phase_kernels.step_cohort`). The cells that
+        transitioned are moved to their phase's next phase, the exit functions of the phases are applied to the cells
+        that left them and the entry functions to the cells that entered them. On the first time-step the entry function
+        of the starting phase is applied to every cell, as in :func:`Phenotype.time_step_phenotype`.
+
+        The returned arrays are reused, they are overwritten by the next time-step. Copy them to keep them.
+
+        :return: Flags (bool) for phase changing, cell death, and cell division, one entry per cell
+        :rtype: tuple of numpy.ndarray
+        """
+        if not self.time_in_population:
+            for index, entry_function in self._entry_functions:
+                entry_function(self.volumes, equal(self.phase_index, index, out=self._enter_mask))
+
+        self.time_in_population += self.dt
+
+        changed_phases = self._transition_mask
+        step_cohort(self.phase_index, self.time_in_phase, self.volumes, self.dt, self._phase_duration,
+                    self._transition_probability, self.rates, self._draw(), changed_phases)
+
+        cell_removed = take(self.removal_at_phase_exit, self.phase_index, out=self._removal_mask)
+        cell_removed &= changed_phases
+        cell_divides = take(self.division_at_phase_exit, self.phase_index, out=self._division_mask)
+        cell_divides &= changed_phases
+
+        if changed_phases.any():
+            for index, exit_function in self._exit_functions:
+                leave = equal(self.phase_index, index, out=self._enter_mask)
+                leave &= changed_phases
+                exit_function(self.volumes, leave)
+
+            cells = flatnonzero(changed_phases)
+            leaving = self.phase_index[cells]
+            entering = self.next_phase_index[leaving]
+            self._swap_phase_volumes(cells, leaving, entering)
+            self.phase_index[cells] = entering
+            self.time_in_phase[cells] = 0
+
+            for index, entry_function in self._entry_functions:
+                enter = equal(self.phase_index, index, out=self._enter_mask)
+                enter &= changed_phases
+                entry_function(self.volumes, enter)
+
+        return changed_phases, cell_removed, cell_divides
+
+    def time_step_population_codes(self):
+        """
+        Time-steps every cell of the population, see :func:`time_step_population`.
+
+        The flags for phase changing, cell death, and cell division are packed as bits of one code per cell, bits
+        `PHASE_CHANGED`, `CELL_REMOVED`, and `CELL_DIVIDES`. E.g., the cells that divided are
+        `numpy.flatnonzero(codes & CELL_DIVIDES)`. The returned array is overwritten by the next time-step.
+
+        :return: State code of each cell
+        :rtype: numpy.ndarray of uint8
+        """
+        changed_phases, cell_removed, cell_divides = self.time_step_population()
+        codes = self._state_codes
+        codes[:] = changed_phases
+        codes[cell_removed] |= CELL_REMOVED
+        codes[cell_divides] |= CELL_DIVIDES
+        return codes
+
+    def _swap_phase_volumes(self, cells, leaving, entering):
+        """
+        Stores the volumes of `cells` as those of the phases they leave and loads the volumes of the phases they enter,
+        then carries over the volumes :func:`Phenotype.set_phase` copies
+
+        :param cells: Indices of the cells changing phase
+        :type cells: numpy.ndarray
+        :param leaving: Phase each cell leaves
+        :type leaving: numpy.ndarray
+        :param entering: Phase each cell enters
+        :type entering: numpy.ndarray
+        """
+        leaving = self._volume_slot[leaving]
+        entering = self._volume_slot[entering]
+        swap = leaving != entering
+        if not swap.all():
+            cells, leaving, entering = cells[swap], leaving[swap], entering[swap]
+        volumes = self.volumes
+        carried = volumes[_CARRIED_VOLUMES[:, None], cells]
+        self._phase_volumes[leaving, :, cells] = volumes[:, cells].T
+        volumes[:, cells] = self._phase_volumes[entering, :, cells].T
+        volumes[_CARRIED_VOLUMES[:, None], cells] = carried
+
+    def _draw(self):
+        """One uniform random number per cell for the stochastic transitions"""
+        if self._stochastic:
+            return self.rng.random(self.number_of_cells, dtype=self.dtype)
+        return self._no_draws
+
+    def phase(self, cell):
+        """
+        Phase of cell `cell`. The phases of the phenotype are templates shared by all the cells in them, the per-cell
+        state (time in phase and volumes) is in the population's arrays.
+
+        :param cell: Index of the cell
+        :type cell: int
+        :return: The phase the cell is in
+        :rtype: :class:`PhenoCellPy.phases.Phase`
+        """
+        return self.phenotype.phases[self.phase_index[cell]]
+
+    def volume(self, name):
+        """
+        Volume `name` of every cell, a view of :attr:`volumes`.
+
+        :param name: Name of the volume, one of :data:`PhenoCellPy._phase_kernels.VOLUME_FIELDS`
+        :type name: str
+        :return: The volume of every cell
+        :rtype: numpy.ndarray
+        """
+        if name not in VOLUME_FIELDS:
+            raise ValueError(f"Unknown volume {name}. Options are {VOLUME_FIELDS}")
+        return self.cell_volumes[name]
+
+    def __str__(self):
+        return f"{self.phenotype.name} population of {self.number_of_cells} cells, at memory " \
+               f"{self.__repr__().split(' ')[-1][:-1]}"
@@ -33,6 +33,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import tissue_forge as tf
 import numpy as np
 
+from math import expm1
 from os.path import abspath
 import time
 
@@ -125,7 +126,7 @@ def shrink_phase_transition(*args):
     phase_duration = args[1]
     total = args[2]
     total_target = args[3]
-    time_check = np.random.uniform() < (1 - np.exp(-dt / phase_duration))
+    time_check = np.random.uniform() < -expm1(-dt / phase_duration)
     volume_check = total <= 1.1 * total_target
     # print("shrink trans", total, 1.1 * total_target)
     return time_check and volume_check
@@ -0,0 +1,116 @@
+"""
+BSD 3-Clause License
+
+Copyright (c) 2023, Juliano Ferrari Gianlupi
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import PhenoCellPy as pcp
+from PhenoCellPy._phase_kernels import VOLUME_FIELDS
+
+# deterministic phenotypes (every phase has a fixed duration), the population must follow the single cell exactly.
+# Enough time-steps for two full cycles of each
+_DETERMINISTIC = {"SimpleLiveCycle": ({"fixed_durations": (True,)}, 3000),
+                  "Ki67Basic": ({"fixed_durations": (True, True)}, 2500),
+                  "FlowCytometryBasic": ({"fixed_durations": (True, True, True)}, 2500)}
+
+# the population solves the volume relaxations exactly, the single cell with odeint
+_RTOL = {"f64": 1e-5, "f32": 1e-4}
+
+
+def _compare(phenotype_name, precision):
+    """
+    Time-steps a Phenotype and a PhasePopulation of the same phenotype side by side, asserting that every cell of the
+    population changes phase, divides, and dies when the single cell does, and has its volumes
+    """
+    kwargs, steps = _DETERMINISTIC[phenotype_name]
+    phenotype_class = getattr(pcp.phenotypes, phenotype_name)
+    cell = phenotype_class(dt=1, **kwargs)
+    population = pcp.PhasePopulation(phenotype_class(dt=1, **kwargs), 3, precision=precision)
+    phase_changes = 0
+
+    for step in range(steps):
+        changed_phases, cell_removed, cell_divides = cell.time_step_phenotype()
+        population_flags = population.time_step_population()
+        phase_changes += changed_phases
+
+        for flag, population_flag in zip((changed_phases, cell_removed, cell_divides), population_flags):
+            assert (population_flag == flag).all(), f"step {step}"
+        assert (population.phase_index == cell.phases.index(cell.current_phase)).all(), f"step {step}"
+        assert np.allclose(population.time_in_phase, cell.current_phase.time_in_phase), f"step {step}"
+        for name in VOLUME_FIELDS:
+            np.testing.assert_allclose(population.volume(name), getattr(cell.current_phase.volume, name),
+                                       rtol=_RTOL[precision], atol=1e-6, err_msg=f"{name}, step {step}")
+
+    # the comparison is only meaningful if the cells went through several phase changes
+    assert phase_changes >= 2 * len(cell.phases)
+
+
+@pytest.mark.parametrize("precision", ("f64", "f32"))
+@pytest.mark.parametrize("phenotype_name", tuple(_DETERMINISTIC))
+def test_population_matches_phenotype(phenotype_name, precision):
+    _compare(phenotype_name, precision)
+
+
+@pytest.mark.parametrize("precision", ("f64", "f32"))
+@pytest.mark.parametrize("phenotype_name", tuple(_DETERMINISTIC))
+def test_population_matches_phenotype_without_numba(phenotype_name, precision):
+    # numba is imported with the kernels, a new interpreter where importing it fails runs the numpy fallback
+    code = f"import sys; sys.modules['numba'] = None; import test_population as test; " \
+           f"import PhenoCellPy._phase_kernels as kernels; assert kernels.njit is None; " \
+           f"test._compare({phenotype_name!r}, {precision!r})"
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.pathsep.join((tests_dir, os.path.dirname(tests_dir), os.environ.get("PYTHONPATH", "")))
+    result = subprocess.run([sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": path},
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_population_volumes_after_phase_change():
+    # Phenotype keeps one CellVolumes per phase and carries only some volumes over on a phase change, the total
+    # volume of a Ki67Basic cell is the Ki67- phase's stale one right after it divides
+    kwargs, _ = _DETERMINISTIC["Ki67Basic"]
+    cell = pcp.phenotypes.Ki67Basic(dt=1, **kwargs)
+    population = pcp.PhasePopulation(pcp.phenotypes.Ki67Basic(dt=1, **kwargs), 1)
+    while not cell.time_step_phenotype()[2]:
+        population.time_step_population()
+    assert population.time_step_population()[2][0]
+    assert population.volume("total")[0] == pytest.approx(cell.current_phase.volume.total)
+
+
+def test_number_of_cells():
+    assert pcp.PhasePopulation(pcp.phenotypes.Ki67Basic(dt=1), np.int64(4)).number_of_cells == 4
+    with pytest.raises(ValueError):
+        pcp.PhasePopulation(pcp.phenotypes.Ki67Basic(dt=1), 2.5)